@@ -0,0 +1,136 @@
+import threading
+import time
+
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal, Slot
+
+RENDER_INTERVAL_MS = 16  # At most ~60 renders per second
+MIN_TICK_MS = 1
+
+
+class AutoplayWorker(QObject):
+    finished = Signal()
+
+    # Advances through a timeline at a given speed on its own thread. Only the
+    # most recent step is kept; steps the display never picked up are dropped.
+    def __init__(self, timeline, start_index, steps_per_second):
+        super().__init__()
+        self.timeline = timeline
+        self.start_index = start_index
+        self.steps_per_second = steps_per_second
+        self.started_at = None
+        self.index = start_index
+        self.timer = None
+        self.lock = threading.Lock()
+        self.latest = None
+
+    @Slot()
+    def start(self):
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.restart_clock()
+
+    @Slot(int)
+    def set_speed(self, steps_per_second):
+        self.start_index = self.index
+        self.steps_per_second = steps_per_second
+        self.restart_clock()
+
+    @Slot()
+    def stop(self):
+        if self.timer is not None:
+            self.timer.stop()
+
+    # Restarts the clock the target step is derived from, so timer jitter never
+    # changes the overall pace.
+    def restart_clock(self):
+        self.started_at = time.perf_counter()
+        self.timer.start(max(MIN_TICK_MS, 1000 // max(self.steps_per_second, 1)))
+
+    # Computes the step the clock says should be shown now.
+    def tick(self):
+        elapsed = time.perf_counter() - self.started_at
+        last = len(self.timeline) - 1
+        target = min(self.start_index + int(elapsed * self.steps_per_second), last)
+        if target != self.index:
+            self.index = target
+            step = self.timeline.step(target)
+            with self.lock:
+                self.latest = (target, step)
+        if target >= last:
+            self.timer.stop()
+            self.finished.emit()
+
+    # Returns and forgets the newest computed (index, TimelineStep), if any.
+    def take_latest(self):
+        with self.lock:
+            latest = self.latest
+            self.latest = None
+        return latest
+
+
+class AutoplayController(QObject):
+    stop_requested = Signal()
+    speed_requested = Signal(int)
+
+    # Plays a timeline, calling render(index, step) on the UI thread at most once
+    # per render interval and done() when the last step has been reached.
+    def __init__(self, render, done, parent=None):
+        super().__init__(parent)
+        self.render = render
+        self.done = done
+        self.thread = None
+        self.worker = None
+        self.render_timer = QTimer(self)
+        self.render_timer.setInterval(RENDER_INTERVAL_MS)
+        self.render_timer.timeout.connect(self.flush)
+
+    # Returns True while a timeline is playing.
+    def is_playing(self):
+        return self.thread is not None
+
+    # Starts playing the timeline from start_index.
+    def play(self, timeline, start_index, steps_per_second):
+        self.stop()
+        self.thread = QThread()
+        self.worker = AutoplayWorker(timeline, start_index, steps_per_second)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.start)
+        self.worker.finished.connect(self.on_finished)
+        self.stop_requested.connect(self.worker.stop, Qt.BlockingQueuedConnection)
+        self.speed_requested.connect(self.worker.set_speed)
+        self.thread.start()
+        self.render_timer.start()
+
+    # Changes the playback speed in steps per second.
+    def set_speed(self, steps_per_second):
+        if self.worker is not None:
+            self.speed_requested.emit(steps_per_second)
+
+    # Stops playing and waits for the worker so the timeline is free again. The
+    # stop request blocks until the worker has stopped its timer on its thread.
+    def stop(self):
+        if self.thread is None:
+            return
+        self.render_timer.stop()
+        self.stop_requested.emit()
+        self.thread.quit()
+        self.thread.wait()
+        self.stop_requested.disconnect(self.worker.stop)
+        self.speed_requested.disconnect(self.worker.set_speed)
+        self.flush()
+        self.worker = None
+        self.thread = None
+
+    # Renders the newest step computed by the worker, if there is one.
+    @Slot()
+    def flush(self):
+        if self.worker is None:
+            return
+        latest = self.worker.take_latest()
+        if latest is not None:
+            self.render(*latest)
+
+    @Slot()
+    def on_finished(self):
+        self.stop()
+        self.done()
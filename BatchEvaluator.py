@@ -0,0 +1,78 @@
+from array import array
+
+from SimulationEngine import FifoEngine, OptimalEngine, next_use_positions
+from StackDistance import lru_fault_counts
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure-Python preprocessing is used instead
+    np = None
+
+DEFAULT_POLICIES = ("FIFO", "LRU", "OPTIMAL")
+
+
+# Returns a trace as a list of Python ints, which the engines hash fastest.
+def as_page_list(trace):
+    if np is not None and isinstance(trace, np.ndarray):
+        return trace.tolist()
+    return list(trace)
+
+
+# Returns the next-use positions of a trace. With NumPy a stable argsort groups
+# the references of each page in time order, so each one's successor in that
+# order is its next use; otherwise the engine's backward pass is used.
+def batch_next_use(trace):
+    if np is None:
+        return next_use_positions(trace)
+    pages = np.asarray(trace)
+    count = len(pages)
+    order = np.argsort(pages, kind="stable")
+    sorted_pages = pages[order]
+    next_use = np.full(count, count, dtype=np.int64)
+    same = sorted_pages[1:] == sorted_pages[:-1]
+    next_use[order[:-1][same]] = order[1:][same]
+    return array("q", next_use.tobytes())
+
+
+# Returns the number of distinct pages in a trace.
+def distinct_pages(trace):
+    if np is not None and isinstance(trace, np.ndarray):
+        return len(np.unique(trace))
+    return len(set(trace))
+
+
+# Evaluates policies over many traces and frame sizes. traces is a 2-D NumPy
+# array or a list of page-id sequences. Returns {policy: faults} where faults[i][j]
+# is the fault count of traces[i] with frame_sizes[j].
+#
+# Per trace the preprocessing is shared: frame sizes at or above the number of
+# distinct pages only take cold misses, LRU comes from one stack-distance pass
+# for every size, and Optimal reuses a single next-use array across sizes.
+def evaluate_batch(traces, frame_sizes, policies=DEFAULT_POLICIES):
+    frame_sizes = [int(frames) for frames in frame_sizes]
+    if any(frames < 1 for frames in frame_sizes):
+        raise ValueError("Frame sizes must be at least 1")
+    results = {policy: [] for policy in policies}
+    for trace in traces:
+        unique = distinct_pages(trace)
+        pages = as_page_list(trace)
+        small_sizes = sorted({frames for frames in frame_sizes if frames < unique})
+
+        for policy in policies:
+            by_size = {}
+            if policy == "LRU" and small_sizes:
+                lru_faults = lru_fault_counts(pages, small_sizes[-1])
+                by_size = {frames: lru_faults[frames - 1] for frames in small_sizes}
+            elif policy == "FIFO":
+                by_size = {frames: FifoEngine(frames).count_faults(pages) for frames in small_sizes}
+            elif policy == "OPTIMAL" and small_sizes:
+                next_use = batch_next_use(trace)
+                for frames in small_sizes:
+                    engine = OptimalEngine(frames)
+                    engine.prepare(pages, next_use)
+                    by_size[frames] = engine.feed(pages)
+            elif policy not in DEFAULT_POLICIES:
+                raise ValueError(f"Unknown policy: {policy}")
+
+            results[policy].append([by_size.get(frames, unique) for frames in frame_sizes])
+    return results
@@ -0,0 +1,263 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from TraceCompression import RUN_LENGTH_TYPECODE, expand_runs, run_length_chunks
+from TraceReader import DEFAULT_CHUNK_SIZE, read_trace_chunks
+
+# Binary trace layout (all integers little-endian):
+#
+#   offset  size  field
+#   0       4     magic b"PRTR"
+#   4       1     format version (1, or 2 when run lengths are present)
+#   5       1     page id width in bytes: 1, 2, 4 or 8
+#   6       2     flags: bit 0 = timestamps present, bit 1 = pids present,
+#                 bit 2 = run lengths present
+#   8       8     number of entries: references, or runs when run-length encoded
+#   16            page ids, count * width bytes
+#                 run lengths, count * 4 bytes (if flagged), 8-byte aligned
+#                 timestamps, count * 8 bytes (if flagged), 8-byte aligned
+#                 pids, count * 4 bytes (if flagged), 8-byte aligned
+MAGIC = b"PRTR"
+VERSION = 1
+RUN_LENGTH_VERSION = 2  # Older readers must refuse run-length traces, not misread them
+HEADER = struct.Struct("<4sBBHQ")
+
+FLAG_TIMESTAMPS = 0x1
+FLAG_PIDS = 0x2
+FLAG_RUN_LENGTHS = 0x4
+
+TYPECODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+TIMESTAMP_TYPECODE = "Q"
+PID_TYPECODE = "I"
+
+
+# Rounds an offset up to the next multiple of 8.
+def align8(offset):
+    return (offset + 7) & ~7
+
+
+# Returns the byte offsets of the page, run length, timestamp and pid arrays.
+def section_offsets(width, flags, count):
+    pages_offset = HEADER.size
+    offset = align8(pages_offset + count * width)
+    run_lengths_offset = None
+    if flags & FLAG_RUN_LENGTHS:
+        run_lengths_offset = offset
+        offset = align8(offset + count * 4)
+    timestamps_offset = None
+    if flags & FLAG_TIMESTAMPS:
+        timestamps_offset = offset
+        offset = align8(offset + count * 8)
+    pids_offset = None
+    if flags & FLAG_PIDS:
+        pids_offset = offset
+    return pages_offset, run_lengths_offset, timestamps_offset, pids_offset
+
+
+# Returns the byte offset just past the last array of a trace.
+def trace_end(width, flags, count):
+    pages_offset, run_lengths_offset, timestamps_offset, pids_offset = section_offsets(width, flags, count)
+    end = pages_offset + count * width
+    if run_lengths_offset is not None:
+        end = run_lengths_offset + count * 4
+    if timestamps_offset is not None:
+        end = timestamps_offset + count * 8
+    if pids_offset is not None:
+        end = pids_offset + count * 4
+    return end
+
+
+# Writes an array in little-endian byte order.
+def write_array(stream, values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(stream)
+
+
+# Pads the stream with zero bytes up to the next 8-byte boundary.
+def pad8(stream):
+    position = stream.tell()
+    stream.write(b"\0" * (align8(position) - position))
+
+
+# Writes integer page ids, and optionally per-reference timestamps and pids,
+# as a binary trace.
+def write_binary_trace(path, pages, width=4, timestamps=None, pids=None):
+    if width not in TYPECODES:
+        raise ValueError(f"Unsupported page id width: {width}")
+    pages = array(TYPECODES[width], pages)
+    flags = 0
+    if timestamps is not None:
+        timestamps = array(TIMESTAMP_TYPECODE, timestamps)
+        flags |= FLAG_TIMESTAMPS
+    if pids is not None:
+        pids = array(PID_TYPECODE, pids)
+        flags |= FLAG_PIDS
+
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, width, flags, len(pages)))
+        write_array(stream, pages)
+        for extra in (timestamps, pids):
+            if extra is not None:
+                if len(extra) != len(pages):
+                    raise ValueError("Timestamps and pids must have one entry per reference")
+                pad8(stream)
+                write_array(stream, extra)
+        pad8(stream)
+
+
+# Writes an iterable of page id chunks as a binary trace without holding more
+# than one chunk in memory. Chunks may be arrays, lists or memoryviews of
+# integers. With run_length, consecutive repeats are stored once with their
+# run length; the run lengths are buffered until the pages are written.
+# Returns the number of references written.
+def write_binary_chunks(destination, chunks, width=4, run_length=False):
+    if width not in TYPECODES:
+        raise ValueError(f"Unsupported page id width: {width}")
+    typecode = TYPECODES[width]
+    version, flags = (RUN_LENGTH_VERSION, FLAG_RUN_LENGTHS) if run_length else (VERSION, 0)
+    run_lengths = array(RUN_LENGTH_TYPECODE)
+    if run_length:
+        chunks = run_length_chunks(chunks)
+    count = 0
+    references = 0
+    with open(destination, "wb") as stream:
+        stream.write(HEADER.pack(MAGIC, version, width, flags, 0))
+        for chunk in chunks:
+            if run_length:
+                chunk, counts = chunk
+                run_lengths.extend(counts)
+                references += sum(counts)
+            if not isinstance(chunk, array) or chunk.typecode != typecode:
+                try:
+                    chunk = array(typecode, chunk)
+                except OverflowError:
+                    raise ValueError(f"Page id does not fit in {width} bytes") from None
+            write_array(stream, chunk)
+            count += len(chunk)
+            if not run_length:
+                references += len(chunk)
+        pad8(stream)
+        if run_length:
+            write_array(stream, run_lengths)
+            pad8(stream)
+        stream.seek(0)
+        stream.write(HEADER.pack(MAGIC, version, width, flags, count))
+    return references
+
+
+# Converts a text trace into a binary trace without holding more than one chunk
+# in memory. Tokens must be integer page ids unless an interner is given, in
+# which case arbitrary labels are mapped to dense ids through it. With
+# run_length, repeats are stored as runs. Returns the number of references
+# written.
+def convert_text_trace(source, destination, width=4, chunk_size=DEFAULT_CHUNK_SIZE, interner=None,
+                       run_length=False):
+    chunks = read_trace_chunks(source, chunk_size)
+    if interner is not None:
+        pages = (interner.intern_all(chunk) for chunk in chunks)
+    else:
+        pages = (map(int, chunk) for chunk in chunks)
+    return write_binary_chunks(destination, pages, width, run_length)
+
+
+class BinaryTrace:
+    # Memory-maps a binary trace. The page, timestamp and pid arrays are exposed
+    # as memoryviews over the mapping, so nothing is copied until it is read.
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self.file.close()
+            raise ValueError(f"{path} is not a binary trace") from None
+
+        size = len(self.map)
+        if size < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a binary trace")
+        magic, version, width, flags, count = HEADER.unpack_from(self.map, 0)
+        if (magic != MAGIC or version not in (VERSION, RUN_LENGTH_VERSION) or width not in TYPECODES
+                or trace_end(width, flags, count) > size):
+            # Truncated files would otherwise fail in view() with the file still mapped
+            self.close()
+            raise ValueError(f"{path} is not a binary trace")
+
+        self.width = width
+        self.flags = flags
+        self.count = count
+        pages_offset, run_lengths_offset, timestamps_offset, pids_offset = section_offsets(width, flags, count)
+        self.pages = self.view(pages_offset, TYPECODES[width], width)
+        self.run_lengths = None
+        self.references = count
+        if run_lengths_offset is not None:
+            self.run_lengths = self.view(run_lengths_offset, RUN_LENGTH_TYPECODE, 4)
+            self.references = sum(self.run_lengths)
+        self.timestamps = None
+        self.pids = None
+        if timestamps_offset is not None:
+            self.timestamps = self.view(timestamps_offset, TIMESTAMP_TYPECODE, 8)
+        if pids_offset is not None:
+            self.pids = self.view(pids_offset, PID_TYPECODE, 4)
+
+    # Returns a typed view of count items starting at offset.
+    def view(self, offset, typecode, itemsize):
+        raw = memoryview(self.map)[offset:offset + self.count * itemsize]
+        if sys.byteorder != "little":
+            # Big-endian hosts pay for one byte-swapped copy
+            values = array(typecode, raw.tobytes())
+            values.byteswap()
+            return memoryview(values)
+        return raw.cast(typecode)
+
+    # Returns the number of stored entries: references, or runs when the trace
+    # is run-length encoded (see references for the expanded count).
+    def __len__(self):
+        return self.count
+
+    # Yields zero-copy slices of the page ids of at most chunk_size references.
+    # The slices share the mapping; release them (or drop them) to let close()
+    # unmap the file straight away.
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        pages = self.pages
+        for start in range(0, self.count, chunk_size):
+            yield pages[start:start + chunk_size]
+
+    # Yields the full reference string in chunks, expanding runs if the trace
+    # is run-length encoded.
+    def reference_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        if self.run_lengths is None:
+            return self.chunks(chunk_size)
+        return expand_runs(self.pages, self.run_lengths, chunk_size)
+
+    # Returns the page ids as a NumPy array sharing memory with the mapping.
+    def as_numpy(self):
+        import numpy as np
+
+        return np.frombuffer(self.pages, dtype=np.dtype(self.pages.format))
+
+    # Releases the views, closes the file and unmaps it. If slices from
+    # chunks() or as_numpy() are still alive, the mapping stays valid for them
+    # and is unmapped once the last one is released.
+    def close(self):
+        for name in ("pages", "run_lengths", "timestamps", "pids"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+            setattr(self, name, None)
+        self.file.close()
+        try:
+            self.map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,36 @@
+from PySide6.QtWidgets import QDialog, QHeaderView, QTableWidget, QTableWidgetItem, QVBoxLayout
+
+from PolicyComparison import compare_policies
+from PageInterner import PageInterner
+from SimulationEngine import ENGINES
+
+HEADERS = ["Policy", "Faults", "Hits", "Hit Ratio"]
+
+
+class ComparisonDialog(QDialog):
+    # Shows the faults and hit ratio of every registered policy for one
+    # reference string, all computed in a single pass over the string.
+    def __init__(self, reference_string, max_frames, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Policy Comparison ({max_frames} frames)")
+        self.resize(520, 420)
+
+        self.table = QTableWidget(0, len(HEADERS), self)
+        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+
+        pages = PageInterner().intern_all(reference_string.split())
+        self.show_rows(compare_policies(pages, list(ENGINES), max_frames))
+
+    # Fills the table with one comparison row per policy.
+    def show_rows(self, rows):
+        self.table.setRowCount(len(rows))
+        for index, row in enumerate(rows):
+            cells = [row["policy"], str(row["faults"]), str(row["hits"]), f"{row['hit_ratio']:.2%}"]
+            for column, text in enumerate(cells):
+                self.table.setItem(index, column, QTableWidgetItem(text))
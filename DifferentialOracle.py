@@ -0,0 +1,217 @@
+import argparse
+import random
+import sys
+
+from PageInterner import PageInterner
+from SimulationEngine import ENGINES
+from SimulationTimeline import SimulationTimeline
+
+
+# The reference policies below are the page replacement logic of the original
+# FifoSimulator, LruSimulator and OptimalSimulator, with the Qt drawing taken
+# out and nothing else changed: list frames, string page labels, and Optimal's
+# future.index lookahead with the oldest-by-frame_ages tie-break. Each step()
+# returns (hit, removed page or None, frames after the step).
+class ReferenceFifo:
+    # Starts an empty FIFO simulation over the reference string.
+    def __init__(self, reference_string, max_frames):
+        self.reference_string = reference_string
+        self.max_frames = max_frames
+        self.frames = []
+        self.current_index = 0
+        self.page_faults = 0
+
+    # Processes the current page and moves on to the next one.
+    def step(self):
+        page = self.reference_string[self.current_index]
+        self.current_index += 1
+        is_hit = page in self.frames
+        if not is_hit:
+            self.page_faults += 1
+
+        removed_page = None
+        if not is_hit and len(self.frames) >= self.max_frames:
+            removed_page = self.frames[0]
+
+        if not is_hit:
+            if removed_page:
+                self.frames.pop(0)
+            self.frames.append(page)
+        return is_hit, removed_page, list(self.frames)
+
+
+class ReferenceLru:
+    # Starts an empty LRU simulation over the reference string.
+    def __init__(self, reference_string, max_frames):
+        self.reference_string = reference_string
+        self.max_frames = max_frames
+        self.frames = []
+        self.usage_history = []
+        self.current_index = 0
+        self.page_faults = 0
+
+    # Processes the current page and moves on to the next one.
+    def step(self):
+        page = self.reference_string[self.current_index]
+        self.current_index += 1
+        hit = page in self.frames
+
+        removed_page = None
+        if hit:
+            self.usage_history.remove(page)
+        else:
+            self.page_faults += 1
+            if len(self.frames) < self.max_frames:
+                self.frames.append(page)
+            else:
+                lru = self.usage_history.pop(0)
+                removed_page = lru
+                self.frames[self.frames.index(lru)] = page
+
+        self.usage_history.append(page)
+        return hit, removed_page, list(self.frames)
+
+
+class ReferenceOptimal:
+    # Starts an empty Optimal simulation over the reference string.
+    def __init__(self, reference_string, max_frames):
+        self.reference_string = reference_string
+        self.max_frames = max_frames
+        self.frames = []
+        self.frame_ages = {}
+        self.age_counter = 0
+        self.current_index = 0
+        self.page_faults = 0
+
+    # Processes the current page and moves on to the next one.
+    def step(self):
+        page = self.reference_string[self.current_index]
+        page_added = False
+        to_replace = None
+
+        if page not in self.frames:
+            self.page_faults += 1
+            page_added = True
+            if len(self.frames) < self.max_frames:
+                self.frames.append(page)
+                self.frame_ages[page] = self.age_counter
+                self.age_counter += 1
+            else:
+                to_replace = self.get_optimal_replacement()
+                replace_index = self.frames.index(to_replace)
+                replaced_frame = self.frames[replace_index]
+                self.frames[replace_index] = page
+                if replaced_frame in self.frame_ages:
+                    del self.frame_ages[replaced_frame]
+                self.frame_ages[page] = self.age_counter
+                self.age_counter += 1
+
+        self.current_index += 1
+        return not page_added, to_replace, list(self.frames)
+
+    # Determines the optimal page to replace based on future references.
+    def get_optimal_replacement(self):
+        future = self.reference_string[self.current_index + 1:]
+        index_map = {}
+        for f in self.frames:
+            if f in future:
+                index_map[f] = future.index(f)
+            else:
+                index_map[f] = float('inf')
+
+        max_index = max(index_map.values())
+        candidates = [f for f, idx in index_map.items() if idx == max_index]
+        if max_index == float('inf') and len(candidates) > 1:
+            return min(candidates, key=lambda f: self.frame_ages.get(f, float('inf')))
+        return candidates[0]
+
+
+REFERENCE_POLICIES = {
+    "FIFO": ReferenceFifo,
+    "LRU": ReferenceLru,
+    "OPTIMAL": ReferenceOptimal,
+}
+
+
+# Runs one case through the reference policy, the engine and the timeline the
+# GUI renders from, and returns a description of the first step where they
+# disagree, or None when every step matches.
+def check_case(policy, labels, max_frames):
+    reference = REFERENCE_POLICIES[policy](labels, max_frames)
+    interner = PageInterner()
+    pages = interner.intern_all(labels)
+    names = interner.labels
+    timeline = SimulationTimeline(ENGINES[policy], pages, max_frames)
+    engine = ENGINES[policy](max_frames)
+
+    for index, result in enumerate(engine.steps(pages)):
+        expected = reference.step()
+        evicted = None if result.evicted is None else names[result.evicted]
+        actual = (result.hit, evicted, [names[page] for page in engine.frames])
+        if actual != expected:
+            return f"step {index} ({labels[index]}): engine {actual}, reference {expected}"
+
+        step = timeline.step(index)
+        rendered = [names[page] for page in step.after]
+        if rendered != expected[2] or step.page_faults != reference.page_faults:
+            return f"step {index} ({labels[index]}): timeline {rendered}, reference {expected[2]}"
+    return None
+
+
+# Returns a random (labels, frames) case. Small alphabets and frame counts
+# make hits, evictions and Optimal's never-used-again ties common.
+def random_case(rng, max_length=60, max_pages=10, max_frames=6):
+    pages = rng.randint(1, max_pages)
+    length = rng.randint(0, max_length)
+    labels = [str(rng.randrange(pages)) for _ in range(length)]
+    return labels, rng.randint(1, max_frames)
+
+
+# Shrinks a failing case by dropping references and frames while it still
+# fails, so the reported counterexample is small.
+def shrink_case(policy, labels, max_frames):
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for index in range(len(labels)):
+            candidate = labels[:index] + labels[index + 1:]
+            if check_case(policy, candidate, max_frames) is not None:
+                labels = candidate
+                shrunk = True
+                break
+        if not shrunk and max_frames > 1 and check_case(policy, labels, max_frames - 1) is not None:
+            max_frames -= 1
+            shrunk = True
+    return labels, max_frames
+
+
+# Checks random cases for each policy and returns (policy, labels, frames,
+# message) for every policy that failed, with its case shrunk.
+def run_oracle(policies, cases, seed):
+    rng = random.Random(seed)
+    failures = []
+    for policy in policies:
+        for _ in range(cases):
+            labels, max_frames = random_case(rng)
+            if check_case(policy, labels, max_frames) is not None:
+                labels, max_frames = shrink_case(policy, labels, max_frames)
+                failures.append((policy, labels, max_frames, check_case(policy, labels, max_frames)))
+                break
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the engines step by step with the original simulator logic.")
+    parser.add_argument("--policies", nargs="+", default=list(REFERENCE_POLICIES),
+                        choices=list(REFERENCE_POLICIES))
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = run_oracle(args.policies, args.cases, args.seed)
+    for policy, labels, max_frames, message in failures:
+        print(f"{policy} differs with {max_frames} frames on {' '.join(labels)!r}: {message}")
+    if not failures:
+        print(f"{', '.join(args.policies)}: {args.cases} cases each match step by step")
+    sys.exit(1 if failures else 0)
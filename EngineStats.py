@@ -0,0 +1,131 @@
+import json
+import time
+from itertools import islice
+
+# References stepped between two tallies while instrumentation is enabled
+RECORD_BATCH = 4096
+
+
+class EngineStats:
+    # Counters collected for one engine while instrumentation is enabled. The
+    # engine's references are timed a chunk at a time and the StepResults are
+    # tallied afterwards, so counting never shows up in the timings. Gauges
+    # are engine-specific sizes, such as Optimal's heap, kept as maxima.
+    def __init__(self, engine):
+        self.policy = engine.name
+        self.frames = engine.max_frames
+        self.clear()
+
+    # Forgets everything collected so far.
+    def clear(self):
+        self.references = 0
+        self.hits = 0
+        self.evictions = 0
+        self.compulsory_faults = 0
+        self.capacity_faults = 0
+        self.seconds = 0.0
+        self.gauges = {}
+        self.seen = set()
+
+    # Applies a batch of references to the engine while collecting counters,
+    # and returns the running fault count like ReplacementEngine.feed. The
+    # batch is stepped RECORD_BATCH references at a time, so the StepResults
+    # held between timing and tallying stay bounded for any trace length.
+    def feed(self, engine, pages):
+        pages = iter(pages)
+        while True:
+            batch = list(islice(pages, RECORD_BATCH))
+            if not batch:
+                return engine.page_faults
+            self.record(self.step_batch(engine, batch))
+
+    # Steps the engine over one sub-batch and returns its StepResults.
+    def step_batch(self, engine, pages):
+        step = engine.step
+        results = []
+        append = results.append
+        gauges = engine.gauges
+        if gauges() is None:
+            start = time.perf_counter()
+            for page in pages:
+                append(step(page))
+            self.seconds += time.perf_counter() - start
+        else:
+            # Sampling the gauges after every step is part of the timing
+            peaks = self.gauges
+            start = time.perf_counter()
+            for page in pages:
+                append(step(page))
+                for name, value in gauges().items():
+                    if value > peaks.get(name, -1):
+                        peaks[name] = value
+            self.seconds += time.perf_counter() - start
+        return results
+
+    # Tallies a batch of StepResults.
+    def record(self, results):
+        seen = self.seen
+        self.references += len(results)
+        for result in results:
+            if result.hit:
+                self.hits += 1
+                continue
+            if result.page in seen:
+                self.capacity_faults += 1
+            else:
+                seen.add(result.page)
+                self.compulsory_faults += 1
+            if result.evicted is not None:
+                self.evictions += 1
+
+    # Returns the number of faults recorded.
+    @property
+    def misses(self):
+        return self.compulsory_faults + self.capacity_faults
+
+    # Returns the average time per reference in nanoseconds.
+    @property
+    def ns_per_reference(self):
+        return self.seconds / self.references * 1e9 if self.references else 0.0
+
+    # Returns the counters as a JSON-serializable dict.
+    def as_dict(self):
+        return {
+            "policy": self.policy,
+            "frames": self.frames,
+            "references": self.references,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "compulsory_faults": self.compulsory_faults,
+            "capacity_faults": self.capacity_faults,
+            "seconds": self.seconds,
+            "ns_per_reference": self.ns_per_reference,
+            "gauges": dict(self.gauges),
+        }
+
+    # Formats the counters as short lines for display.
+    def summary_lines(self):
+        lines = [
+            f"Hits {self.hits}  Misses {self.misses}",
+            f"Compulsory {self.compulsory_faults}  Capacity {self.capacity_faults}",
+            f"Evictions {self.evictions}  Time/ref {self.ns_per_reference:.0f} ns",
+        ]
+        for name, value in sorted(self.gauges.items()):
+            lines.append(f"Max {name.replace('_', ' ')} {value}")
+        return lines
+
+
+# Runs a policy over a reference string with instrumentation enabled and
+# returns its EngineStats.
+def collect_stats(engine_class, reference_string, max_frames):
+    engine = engine_class(max_frames)
+    engine.enable_stats()
+    engine.count_faults(reference_string)
+    return engine.stats
+
+
+# Writes the counters of several runs as a JSON list.
+def write_stats_json(stats, stream):
+    json.dump([entry.as_dict() for entry in stats], stream, indent=2)
+    stream.write("\n")
@@ -0,0 +1,83 @@
+from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import Qt
+
+# Roles a frame box can take; None is the plain, uncoloured box.
+REMOVED = "removed"  # red = to be removed
+HIT = "hit"  # green = hit / retained
+ADDED = "added"  # blue = newly added
+
+# One stylesheet per container, selecting on the box role property, replaces the
+# per-label stylesheet strings that Qt had to parse on every step.
+BOX_STYLE = """
+QLabel[box="true"] { border: 1px solid #555; border-radius: 5px; padding: 5px; font-size: 16px; color: white; }
+QLabel[role="removed"] { background-color: #D32F2F; }
+QLabel[role="hit"] { background-color: #4CAF50; }
+QLabel[role="added"] { background-color: #2196F3; }
+"""
+
+
+class FrameBoxPool:
+    pools = {}
+
+    # Returns the pool owning the boxes of a frame, creating it on first use.
+    # Pools are shared, so every simulator drawing into a frame reuses its boxes.
+    @classmethod
+    def for_frame(cls, frame):
+        pool = cls.pools.get(frame)
+        if pool is None:
+            pool = cls(frame)
+            cls.pools[frame] = pool
+        return pool
+
+    # Takes over the frame: clears whatever the designer placed in it and applies
+    # the shared box stylesheet.
+    def __init__(self, frame):
+        self.frame = frame
+        self.labels = []
+        self.shown = []  # (text, role) currently displayed by each label
+        self.visible = 0
+        frame.setStyleSheet(BOX_STYLE)
+        layout = frame.layout()
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget:
+                widget.setParent(None)
+
+    # Displays the given (text, role) boxes, touching only labels whose text,
+    # role or visibility changed since the previous call.
+    def show_boxes(self, boxes):
+        labels = self.labels
+        shown = self.shown
+        for i, box in enumerate(boxes):
+            if i == len(labels):
+                labels.append(self.create_label())
+                shown.append((None, None))
+            old_text, old_role = shown[i]
+            text, role = box
+            label = labels[i]
+            if text != old_text:
+                label.setText(text)
+            if role != old_role:
+                label.setProperty("role", role or "")
+                # Dynamic property selectors are only re-evaluated on polish
+                label.style().unpolish(label)
+                label.style().polish(label)
+            shown[i] = box
+            if i >= self.visible:
+                label.setVisible(True)
+
+        for i in range(len(boxes), self.visible):
+            labels[i].setVisible(False)
+        self.visible = len(boxes)
+
+    # Hides every box without destroying it.
+    def clear(self):
+        self.show_boxes([])
+
+    # Creates a pooled box label inside the frame.
+    def create_label(self):
+        label = QLabel(self.frame)
+        label.setProperty("box", True)
+        label.setAlignment(Qt.AlignCenter)
+        self.frame.layout().addWidget(label)
+        return label
@@ -1,27 +1,22 @@
-import os
-import sys
 import random
 from PySide6.QtWidgets import QSizePolicy
-from PySide6.QtWidgets import QMainWindow, QMessageBox
-from PySide6.QtUiTools import QUiLoader
-from PageSequenceDisplay import display_page_sequence
-from FifoSimulator import FifoSimulator
-from LruSimulator import LruSimulator
-from OptimalSimulator import OptimalSimulator
+from PySide6.QtWidgets import QDialog, QMainWindow, QMessageBox, QPushButton, QSlider, QSpinBox, QComboBox
+from PySide6.QtWidgets import QCheckBox, QFrame, QLabel, QHBoxLayout, QVBoxLayout
+from PySide6.QtCore import Qt
+from Page_Simulator_ui import Ui_MainWindow
+from SimulationEngine import ENGINES
+
+# Longest reference string the generator will produce
+MAX_REFERENCE_LENGTH = 100000
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Load the UI file correctly whether running normally or from a PyInstaller bundle
-        loader = QUiLoader()
-        if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS  # PyInstaller temporary folder
-        else:
-            base_path = os.path.abspath(".")
-
-        ui_file_path = os.path.join(base_path, "Page_Simulator.ui")
-        self.ui = loader.load(ui_file_path, None)
+        # Build the UI from the precompiled class instead of parsing the .ui file
+        self.ui_widget = QDialog()
+        self.ui = Ui_MainWindow()
+        self.ui.setupUi(self.ui_widget)
 
         # Hide completion label initially
         self.ui.Completion_Label.setVisible(False)
@@ -35,16 +30,74 @@ class MainWindow(QMainWindow):
         self.ui.Hit_Miss_Line_Edit.setReadOnly(True)
         self.ui.Page_Faults_Line_Edit.setReadOnly(True)
 
-        # Set up simulators
-        self.fifo_simulator = FifoSimulator(self.ui)
-        self.lru_simulator = LruSimulator(self.ui)
-        self.optimal_simulator = OptimalSimulator(self.ui)
+        # Qt truncates line edits at 32767 characters; a generated string is
+        # one digit and one space per reference
+        self.ui.Reference_String_Line_Edit.setMaxLength(2 * MAX_REFERENCE_LENGTH)
+
+        # Step back button and step slider in a row under the simulation state frames
+        self.Previous_Button = QPushButton("PREV", self.ui.groupBox_3)
+        self.Previous_Button.setStyleSheet(self.ui.Next_Button.styleSheet())
+        self.Previous_Button.setEnabled(False)
+        self.Step_Slider = QSlider(Qt.Horizontal, self.ui.groupBox_3)
+        self.Step_Slider.setEnabled(False)
+
+        # Autoplay controls: play/pause and speed in steps per second
+        self.Play_Button = QPushButton("PLAY", self.ui.groupBox_3)
+        self.Play_Button.setStyleSheet(self.ui.Next_Button.styleSheet())
+        self.Play_Button.setEnabled(False)
+        self.Speed_Spin_Box = QSpinBox(self.ui.groupBox_3)
+        self.Speed_Spin_Box.setRange(1, 100000)
+        self.Speed_Spin_Box.setValue(5)
+        self.Speed_Spin_Box.setSuffix(" /s")
+        self.Speed_Spin_Box.setStyleSheet(self.ui.Frame_Line_Edit.styleSheet())
+        self.autoplay = None
+
+        self.Step_Controls_Layout = QHBoxLayout()
+        self.Step_Controls_Layout.addWidget(self.Previous_Button)
+        self.Step_Controls_Layout.addWidget(self.Step_Slider, 1)
+        self.Step_Controls_Layout.addWidget(self.Play_Button)
+        self.Step_Controls_Layout.addWidget(self.Speed_Spin_Box)
+        self.ui.gridLayout_8.addLayout(self.Step_Controls_Layout, 3, 0, 1, 3)
+
+        # Engine statistics panel under the status frame, collected only when checked
+        self.Stats_Frame = QFrame(self.ui_widget)
+        self.Stats_Frame.setStyleSheet(self.ui.frame_2.styleSheet())
+        self.Stats_Check_Box = QCheckBox("Engine Stats", self.Stats_Frame)
+        self.Stats_Check_Box.setStyleSheet("color: white; font-size: 14px; border: 0;")
+        self.Stats_Label = QLabel(self.Stats_Frame)
+        self.Stats_Label.setStyleSheet("color: white; font-size: 11px; border: 0;")
+        self.Stats_Label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        stats_layout = QVBoxLayout(self.Stats_Frame)
+        stats_layout.addWidget(self.Stats_Check_Box)
+        stats_layout.addWidget(self.Stats_Label, 1)
+        self.ui.gridLayout_9.addWidget(self.Stats_Frame, 4, 1, 1, 2)
+
+        # Simulators are created the first time their algorithm is selected
+        self.simulators = {}
+
+        # Every registered policy can also be picked from a drop-down
+        self.Policy_Combo_Box = QComboBox(self.ui.frame_5)
+        self.Policy_Combo_Box.setStyleSheet(self.ui.Frame_Line_Edit.styleSheet())
+        self.Policy_Combo_Box.setPlaceholderText("Algorithm")
+        self.Policy_Combo_Box.addItems(list(ENGINES))
+        self.Policy_Combo_Box.setCurrentIndex(-1)
+
+        # Runs every policy over the reference string side by side
+        self.Compare_Button = QPushButton("COMPARE", self.ui.frame_5)
+        self.Compare_Button.setStyleSheet(self.ui.Confirm_Button.styleSheet())
+
+        # Both sit left of the confirm button, in the reference string grid
+        policy_layout = QHBoxLayout()
+        policy_layout.addWidget(self.Policy_Combo_Box, 1)
+        policy_layout.addWidget(self.Compare_Button)
+        self.ui.gridLayout_6.addLayout(policy_layout, 2, 0, 1, 1)
 
         # Algorithm selection
         self.selected_algorithm = None
         self.ui.FIFO_Button.clicked.connect(lambda: self.select_algorithm("FIFO"))
         self.ui.LRU_Button.clicked.connect(lambda: self.select_algorithm("LRU"))
         self.ui.Optimal_Button.clicked.connect(lambda: self.select_algorithm("OPTIMAL"))
+        self.Policy_Combo_Box.textActivated.connect(self.select_algorithm)
 
         # Main button actions
         self.ui.Generate_Button.clicked.connect(self.generate_reference_string)
@@ -52,12 +105,17 @@ class MainWindow(QMainWindow):
         self.ui.Clear_Button.clicked.connect(self.clear_simulation)
         self.ui.Start_Button.clicked.connect(self.start_simulation)
         self.ui.Next_Button.clicked.connect(self.next_step)
+        self.Previous_Button.clicked.connect(self.previous_step)
+        self.Step_Slider.valueChanged.connect(self.seek_step)
+        self.Play_Button.clicked.connect(self.toggle_autoplay)
+        self.Compare_Button.clicked.connect(self.compare_policies)
+        self.Speed_Spin_Box.valueChanged.connect(self.set_autoplay_speed)
 
         # Window settings
         self.setWindowTitle("Page Replacement Algorithms")
         self.setMinimumSize(800, 600)  
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setCentralWidget(self.ui)
+        self.setCentralWidget(self.ui_widget)
 
     # Generate a random reference string based on user input and display it in the reference string line edit
     def generate_reference_string(self):
@@ -67,8 +125,8 @@ class MainWindow(QMainWindow):
             return
 
         length = int(length_text)
-        if length > 12:
-            QMessageBox.warning(self, "Limit Exceeded", "Maximum length allowed is 12.")
+        if length > MAX_REFERENCE_LENGTH:
+            QMessageBox.warning(self, "Limit Exceeded", f"Maximum length allowed is {MAX_REFERENCE_LENGTH}.")
             return
 
         ref_string = [str(random.randint(0, 9)) for _ in range(length)]
@@ -76,14 +134,16 @@ class MainWindow(QMainWindow):
 
     # Display the page sequence in the container when the confirm button is clicked
     def on_confirm_clicked(self):
+        from PageSequenceDisplay import display_page_sequence
         reference = self.ui.Reference_String_Line_Edit.text()
         display_page_sequence(self.ui.Page_Sequence_Container, reference)
         self.ui.Start_Button.setEnabled(True)
 
     # Select the algorithm based on the button clicked
     def select_algorithm(self, algo):
-        print(f"Selected algorithm: {algo}")
+        self.pause_autoplay()
         self.selected_algorithm = algo
+        self.Policy_Combo_Box.setCurrentIndex(self.Policy_Combo_Box.findText(algo))
 
         # Set the Algorithm name in the Line Edit
         if self.selected_algorithm:
@@ -92,8 +152,22 @@ class MainWindow(QMainWindow):
             self.ui.Algorithm_Line_Edit.setText("None")
             return
 
+    # Show every policy's faults for the current reference string and frame count
+    def compare_policies(self):
+        reference = self.ui.Reference_String_Line_Edit.text()
+        frame_text = self.ui.Frame_Line_Edit.text()
+        if not reference or not frame_text.isdigit():
+            QMessageBox.warning(self, "Invalid Input", "Enter a reference string and a frame count first.")
+            return
+        if int(frame_text) < 1:
+            QMessageBox.warning(self, "Invalid Input", "Frame count must be at least 1.")
+            return
+        from ComparisonDialog import ComparisonDialog
+        ComparisonDialog(reference, int(frame_text), self).exec()
+
     # Start the simulation
     def start_simulation(self):
+        self.pause_autoplay()
         self.ui.Next_Button.setEnabled(True)
         reference = self.ui.Reference_String_Line_Edit.text()
         frame_text = self.ui.Frame_Line_Edit.text()
@@ -103,25 +177,143 @@ class MainWindow(QMainWindow):
             return
 
         frames = int(frame_text)
+        if frames < 1:
+            QMessageBox.warning(self, "Invalid Input", "Frame count must be at least 1.")
+            return
+
+        simulator = self.active_simulator()
+        if simulator is None:
+            return
+        simulator.start(reference, frames)
 
-        if self.selected_algorithm == "FIFO":
-            self.fifo_simulator.start(reference, frames)
-        elif self.selected_algorithm == "LRU":
-            self.lru_simulator.start(reference, frames)
-        elif self.selected_algorithm == "OPTIMAL":
-            self.optimal_simulator.start(reference, frames)
+        self.show_engine_stats(simulator, frames)
+
+        self.Previous_Button.setEnabled(True)
+        self.Play_Button.setEnabled(True)
+        self.Step_Slider.setEnabled(True)
+        self.Step_Slider.blockSignals(True)
+        self.Step_Slider.setRange(0, max(len(simulator.reference_string) - 1, 0))
+        self.Step_Slider.blockSignals(False)
+        self.sync_step_slider()
+
+    # Run the selected policy instrumented and show its counters, if enabled
+    def show_engine_stats(self, simulator, frames):
+        if not self.Stats_Check_Box.isChecked():
+            self.Stats_Label.setText("")
+            return
+        from EngineStats import collect_stats
+        stats = collect_stats(ENGINES[self.selected_algorithm], simulator.reference_string, frames)
+        self.Stats_Label.setText("\n".join(stats.summary_lines()))
+
+    # Returns the simulator of the selected algorithm, creating it on first use
+    def active_simulator(self):
+        algorithm = self.selected_algorithm
+        if algorithm not in ENGINES:
+            return None
+        simulator = self.simulators.get(algorithm)
+        if simulator is None:
+            simulator = self.create_simulator(algorithm)
+            self.simulators[algorithm] = simulator
+        return simulator
+
+    # Imports and creates the simulator for any registered algorithm
+    def create_simulator(self, algorithm):
+        from PolicySimulator import PolicySimulator
+        return PolicySimulator(self.ui, algorithm)
 
     # Display the next step in the simulation when the next button is clicked
     def next_step(self):
-        if self.selected_algorithm == "FIFO":
-            self.fifo_simulator.next()
-        elif self.selected_algorithm == "LRU":
-            self.lru_simulator.next()
-        elif self.selected_algorithm == "OPTIMAL":
-            self.optimal_simulator.next()
+        self.pause_autoplay()
+        simulator = self.active_simulator()
+        if simulator is not None:
+            simulator.next()
+            self.sync_step_slider()
+
+    # Display the previous step in the simulation when the prev button is clicked
+    def previous_step(self):
+        self.pause_autoplay()
+        simulator = self.active_simulator()
+        if simulator is not None:
+            simulator.previous()
+            self.sync_step_slider()
+
+    # Jump to the step chosen with the slider
+    def seek_step(self, index):
+        self.pause_autoplay()
+        simulator = self.active_simulator()
+        if simulator is not None:
+            simulator.seek(index)
+
+    # Move the slider to the simulator's current step without re-seeking
+    def sync_step_slider(self):
+        simulator = self.active_simulator()
+        if simulator is None:
+            return
+        self.Step_Slider.blockSignals(True)
+        self.Step_Slider.setValue(min(simulator.current_index, self.Step_Slider.maximum()))
+        self.Step_Slider.blockSignals(False)
+
+    # Play or pause stepping through the simulation automatically
+    def toggle_autoplay(self):
+        if self.autoplay is not None and self.autoplay.is_playing():
+            self.pause_autoplay()
+            return
+
+        simulator = self.active_simulator()
+        if simulator is None or simulator.timeline is None:
+            return
+        if self.autoplay is None:
+            from AutoplayController import AutoplayController
+            self.autoplay = AutoplayController(self.render_autoplay_step, self.autoplay_finished, self)
+        start_index = min(simulator.current_index, len(simulator.timeline) - 1)
+        self.autoplay.play(simulator.timeline, start_index, self.Speed_Spin_Box.value())
+        self.Play_Button.setText("PAUSE")
+
+    # Stop autoplay, leaving the simulation on the last rendered step
+    def pause_autoplay(self):
+        if self.autoplay is not None:
+            self.autoplay.stop()
+        self.Play_Button.setText("PLAY")
+
+    # Pass a new speed on to a running autoplay
+    def set_autoplay_speed(self, steps_per_second):
+        if self.autoplay is not None:
+            self.autoplay.set_speed(steps_per_second)
+
+    # Render the newest step computed by the autoplay worker
+    def render_autoplay_step(self, index, step):
+        simulator = self.active_simulator()
+        if simulator is not None:
+            simulator.render_step(index, step)
+            self.sync_step_slider()
+
+    # Autoplay reached the last step
+    def autoplay_finished(self):
+        self.Play_Button.setText("PLAY")
+        self.ui.Completion_Label.setVisible(True)
 
     # Clear the simulation and reset the UI
     def clear_simulation(self):
-        self.fifo_simulator.clear_simulation()
-        self.lru_simulator.clear_simulation()
-        self.optimal_simulator.clear_simulation()
+        self.pause_autoplay()
+        for simulator in self.simulators.values():
+            simulator.clear_simulation()
+        if not self.simulators:
+            self.clear_inputs()
+        self.Policy_Combo_Box.setCurrentIndex(-1)
+        self.Stats_Label.setText("")
+        self.Previous_Button.setEnabled(False)
+        self.Play_Button.setEnabled(False)
+        self.Step_Slider.setEnabled(False)
+        self.Step_Slider.blockSignals(True)
+        self.Step_Slider.setRange(0, 0)
+        self.Step_Slider.blockSignals(False)
+
+    # Reset the inputs and page sequence when no simulator has been created yet
+    def clear_inputs(self):
+        from PageSequenceDisplay import clear_page_sequence
+        clear_page_sequence(self.ui.Page_Sequence_Container)
+        self.ui.Reference_String_Line_Edit.setText("")
+        self.ui.Length_Line_Edit.setText("")
+        self.ui.Frame_Line_Edit.setText("")
+        self.ui.Completion_Label.setVisible(False)
+        self.ui.Algorithm_Line_Edit.setText("")
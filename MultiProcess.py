@@ -0,0 +1,294 @@
+import argparse
+import json
+import sys
+from array import array
+from collections import OrderedDict
+
+from PageInterner import ID_TYPECODE, PageInterner
+from SimulationEngine import ENGINES
+from SimulatorCli import positive_int
+
+SCOPES = ("global", "equal", "proportional", "pff")
+DEFAULT_PFF_THRESHOLD = 16
+PID_SEPARATOR = ":"
+
+
+# Reads a trace of references tagged with process ids. Binary traces must carry
+# the pid array; text traces use "pid:page" tokens. Returns (pids, pages) as
+# parallel sequences, with pages still in each process's own numbering.
+def read_tagged_trace(path):
+    from BinaryTrace import MAGIC, BinaryTrace
+    from TraceReader import read_trace_chunks
+
+    if path != "-":
+        with open(path, "rb") as stream:
+            binary = stream.read(len(MAGIC)) == MAGIC
+        if binary:
+            trace = BinaryTrace(path)
+            if trace.pids is None:
+                trace.close()
+                raise ValueError(f"{path} has no process ids")
+            return trace.pids, trace.pages
+
+    pids = array("I")
+    pages = []
+    for chunk in read_trace_chunks(path):
+        for token in chunk:
+            pid, separator, page = token.partition(PID_SEPARATOR)
+            if not separator:
+                raise ValueError(f"Reference {token!r} is not tagged as pid{PID_SEPARATOR}page")
+            pids.append(int(pid))
+            pages.append(page)
+    return pids, pages
+
+
+# Gives every (pid, page) pair a dense id, so pages of different processes
+# never collide. Returns the ids and the interner holding the pairs.
+def global_page_ids(pids, pages):
+    interner = PageInterner()
+    intern = interner.intern
+    ids = array(ID_TYPECODE, [intern(pair) for pair in zip(pids, pages)])
+    return ids, interner
+
+
+class ProcessCounters:
+    # Per-process references, faults and frames, created the first time a
+    # process is seen so thousands of processes cost only what they use.
+    def __init__(self):
+        self.references = {}
+        self.faults = {}
+        self.frames = {}  # Allocation, or peak resident set for variable scopes
+
+    # Returns the result of a run: aggregate counts and one row per process,
+    # in order of first reference.
+    def result(self, scope, policy, max_frames):
+        processes = [{
+            "pid": pid,
+            "references": references,
+            "faults": self.faults.get(pid, 0),
+            "frames": self.frames.get(pid, 0),
+        } for pid, references in self.references.items()]
+        return {
+            "scope": scope,
+            "policy": policy,
+            "frames": max_frames,
+            "references": sum(self.references.values()),
+            "faults": sum(self.faults.values()),
+            "processes": processes,
+        }
+
+
+# Counts the references of every process, in order of first reference.
+def process_references(pids):
+    references = {}
+    for pid in pids:
+        references[pid] = references.get(pid, 0) + 1
+    return references
+
+
+# One frame pool shared by all processes: a single engine sees every
+# reference, and the faulting process may take a frame from any other.
+def simulate_global(engine_class, pids, pages, max_frames):
+    ids, interner = global_page_ids(pids, pages)
+    owners = interner.labels
+    engine = engine_class(max_frames)
+    engine.reset()
+    if engine.offline:
+        engine.prepare(ids)
+
+    counters = ProcessCounters()
+    references = counters.references
+    faults = counters.faults
+    peaks = counters.frames
+    resident = {}
+    step = engine.step
+    for pid, page in zip(pids, ids):
+        references[pid] = references.get(pid, 0) + 1
+        result = step(page)
+        if result.hit:
+            continue
+        faults[pid] = faults.get(pid, 0) + 1
+        if result.evicted is not None:
+            owner = owners[result.evicted][0]
+            resident[owner] -= 1
+        count = resident.get(pid, 0) + 1
+        resident[pid] = count
+        if count > peaks.get(pid, 0):
+            peaks[pid] = count
+    return counters.result("global", engine_class.name, max_frames)
+
+
+# Splits the frames evenly, the first processes to appear taking the remainder.
+def equal_allocation(pids, max_frames):
+    processes = list(process_references(pids))
+    if len(processes) > max_frames:
+        raise ValueError(f"{len(processes)} processes cannot share {max_frames} frames")
+    share, extra = divmod(max_frames, len(processes)) if processes else (0, 0)
+    return {pid: share + (1 if index < extra else 0) for index, pid in enumerate(processes)}
+
+
+# Splits the frames in proportion to each process's number of distinct pages,
+# at least one frame each, handing leftovers out by largest remainder.
+def proportional_allocation(pids, pages, max_frames):
+    distinct = {}
+    for pair in set(zip(pids, pages)):
+        distinct[pair[0]] = distinct.get(pair[0], 0) + 1
+    processes = list(process_references(pids))
+    if len(processes) > max_frames:
+        raise ValueError(f"{len(processes)} processes cannot share {max_frames} frames")
+    total = sum(distinct.values())
+    shares = {pid: max_frames * distinct[pid] / total for pid in processes}
+    allocation = {pid: max(1, int(share)) for pid, share in shares.items()}
+
+    left = max_frames - sum(allocation.values())
+    by_remainder = sorted(processes, key=lambda pid: allocation[pid] - shares[pid])
+    for pid in by_remainder[:max(left, 0)]:
+        allocation[pid] += 1
+    # Frames given out by the one-frame minimum come back from the largest
+    by_size = sorted(processes, key=lambda pid: -allocation[pid])
+    while left < 0:
+        for pid in by_size:
+            if left == 0:
+                break
+            if allocation[pid] > 1:
+                allocation[pid] -= 1
+                left += 1
+    return allocation
+
+
+# Fixed local allocation: every process has its own engine with its own
+# frames, created on its first reference. Offline engines are prepared with
+# the process's own references.
+def simulate_local(engine_class, pids, pages, max_frames, allocation="equal"):
+    ids, _ = global_page_ids(pids, pages)
+    if allocation == "equal":
+        frames = equal_allocation(pids, max_frames)
+    elif allocation == "proportional":
+        frames = proportional_allocation(pids, ids, max_frames)
+    else:
+        raise ValueError(f"Unknown allocation: {allocation}")
+
+    own_references = None
+    if engine_class.offline:
+        own_references = {}
+        for pid, page in zip(pids, ids):
+            own_references.setdefault(pid, []).append(page)
+
+    engines = {}
+    counters = ProcessCounters()
+    references = counters.references
+    for pid, page in zip(pids, ids):
+        engine = engines.get(pid)
+        if engine is None:
+            engine = engine_class(frames[pid])
+            engine.reset()
+            if engine.offline:
+                engine.prepare(own_references.pop(pid))
+            engines[pid] = engine
+            references[pid] = 0
+        references[pid] += 1
+        engine.step(page)
+
+    for pid, engine in engines.items():
+        counters.faults[pid] = engine.page_faults
+        counters.frames[pid] = frames[pid]
+    return counters.result(allocation, engine_class.name, max_frames)
+
+
+class PffProcess:
+    # Resident pages of one process under page-fault-frequency control, in
+    # LRU order, with the pages used since its last fault.
+    def __init__(self):
+        self.resident = OrderedDict()
+        self.used = set()
+        self.time = 0  # References made by this process
+        self.last_fault = None
+        self.peak = 0
+
+
+# Page-fault-frequency allocation: a process that faults again within
+# threshold of its own references grows by the faulting page; one that went
+# longer first releases every page it has not used since its last fault.
+# When the pool is full the faulting process replaces its own least recently
+# used page, or takes one from the process holding the most frames.
+def simulate_pff(pids, pages, max_frames, threshold=DEFAULT_PFF_THRESHOLD):
+    ids, _ = global_page_ids(pids, pages)
+    processes = {}
+    counters = ProcessCounters()
+    references = counters.references
+    faults = counters.faults
+    free = max_frames
+
+    for pid, page in zip(pids, ids):
+        process = processes.get(pid)
+        if process is None:
+            process = processes[pid] = PffProcess()
+            references[pid] = 0
+            faults[pid] = 0
+        references[pid] += 1
+        process.time += 1
+        resident = process.resident
+        if page in resident:
+            resident.move_to_end(page)
+            process.used.add(page)
+            continue
+
+        faults[pid] += 1
+        if process.last_fault is not None and process.time - process.last_fault > threshold:
+            for old in [old for old in resident if old not in process.used]:
+                del resident[old]
+                free += 1
+        process.used = {page}
+        process.last_fault = process.time
+
+        if not free:
+            if resident:
+                resident.popitem(last=False)
+            else:
+                victim = max(processes.values(), key=lambda other: len(other.resident))
+                victim.resident.popitem(last=False)
+            free += 1
+        resident[page] = True
+        free -= 1
+        if len(resident) > process.peak:
+            process.peak = len(resident)
+
+    for pid, process in processes.items():
+        counters.frames[pid] = process.peak
+    return counters.result("pff", "PFF", max_frames)
+
+
+# Runs one replacement scope and returns its result.
+def simulate_scope(scope, engine_class, pids, pages, max_frames, pff_threshold=DEFAULT_PFF_THRESHOLD):
+    if max_frames < 1:
+        raise ValueError("Frame count must be at least 1")
+    if scope == "global":
+        return simulate_global(engine_class, pids, pages, max_frames)
+    if scope in ("equal", "proportional"):
+        return simulate_local(engine_class, pids, pages, max_frames, scope)
+    if scope == "pff":
+        return simulate_pff(pids, pages, max_frames, pff_threshold)
+    raise ValueError(f"Unknown scope: {scope}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulate a multi-process trace under global and local replacement.")
+    parser.add_argument("trace", help='binary trace with pids, or text trace of "pid:page" tokens')
+    parser.add_argument("--scopes", nargs="+", choices=SCOPES, default=list(SCOPES))
+    parser.add_argument("--policy", choices=list(ENGINES), default="LRU",
+                        help="policy of the global and fixed local scopes")
+    parser.add_argument("--frames", type=positive_int, required=True)
+    parser.add_argument("--pff-threshold", type=int, default=DEFAULT_PFF_THRESHOLD)
+    parser.add_argument("--per-process", action="store_true", help="include one row per process")
+    args = parser.parse_args()
+
+    pids, pages = read_tagged_trace(args.trace)
+    results = []
+    for scope in args.scopes:
+        result = simulate_scope(scope, ENGINES[args.policy], pids, pages, args.frames, args.pff_threshold)
+        if not args.per_process:
+            del result["processes"]
+        results.append(result)
+    json.dump(results, sys.stdout, indent=2)
+    print()
@@ -0,0 +1,63 @@
+from array import array
+
+ID_TYPECODE = "I"
+
+
+class PageInterner:
+    # Maps arbitrary page labels to dense integer ids, assigned in order of first
+    # appearance, and back again for display.
+    def __init__(self, labels=()):
+        self.ids = {}
+        self.labels = []
+        for label in labels:
+            self.intern(label)
+
+    # Returns the id of a label, assigning the next free id on first sight.
+    def intern(self, label):
+        page_id = self.ids.get(label)
+        if page_id is None:
+            page_id = len(self.labels)
+            self.ids[label] = page_id
+            self.labels.append(label)
+        return page_id
+
+    # Interns a sequence of labels and returns their ids as a compact array.
+    def intern_all(self, labels):
+        ids = self.ids
+        get = ids.get
+        known = self.labels
+        result = array(ID_TYPECODE)
+        append = result.append
+        for label in labels:
+            page_id = get(label)
+            if page_id is None:
+                page_id = len(known)
+                ids[label] = page_id
+                known.append(label)
+            append(page_id)
+        return result
+
+    # Returns the label of an id.
+    def label(self, page_id):
+        return self.labels[page_id]
+
+    # Returns the labels of a sequence of ids.
+    def labels_for(self, page_ids):
+        labels = self.labels
+        return [labels[page_id] for page_id in page_ids]
+
+    # Returns the number of distinct pages seen so far.
+    def __len__(self):
+        return len(self.labels)
+
+    # Writes the label table, one label per line in id order.
+    def save(self, path):
+        with open(path, "w") as stream:
+            for label in self.labels:
+                stream.write(f"{label}\n")
+
+    # Reads a label table written by save().
+    @classmethod
+    def load(cls, path):
+        with open(path) as stream:
+            return cls(line.rstrip("\n") for line in stream)
@@ -1,25 +1,114 @@
-from PySide6.QtWidgets import QLabel, QHBoxLayout
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QHBoxLayout, QListView, QStyledItemDelegate, QAbstractItemView, QFrame
+from PySide6.QtGui import QFont, QColor, QPen
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PageInterner import PageInterner
 
-def display_page_sequence(container_widget, reference_string):
-    # Clear previous widgets
-    if container_widget.layout() is None:
+CELL_SIZE = 40
+CELL_SPACING = 6
+CURRENT_ROLE = Qt.UserRole + 1
+
+
+class PageSequenceModel(QAbstractListModel):
+    # Holds the reference string as interned page ids, so a trace costs a few
+    # bytes per reference no matter how long it is.
+    def __init__(self, reference_string="", parent=None):
+        super().__init__(parent)
+        if isinstance(reference_string, str):
+            reference_string = reference_string.split()
+        self.interner = PageInterner()
+        self.page_ids = self.interner.intern_all(reference_string)
+        self.current = -1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.page_ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.interner.labels[self.page_ids[index.row()]]
+        if role == CURRENT_ROLE:
+            return index.row() == self.current
+        return None
+
+    # Moves the highlight to the given position, repainting only the two cells
+    # involved.
+    def set_current(self, row):
+        previous = self.current
+        self.current = row
+        for changed in (previous, row):
+            if 0 <= changed < len(self.page_ids):
+                cell = self.index(changed)
+                self.dataChanged.emit(cell, cell, [CURRENT_ROLE])
+
+
+class PageCellDelegate(QStyledItemDelegate):
+    # Paints each reference as a rounded square, highlighting the current one.
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        rect = QRectF(option.rect).adjusted(CELL_SPACING / 2, 1, -CELL_SPACING / 2, -1)
+        current = index.data(CURRENT_ROLE)
+        painter.setPen(QPen(QColor("#2196F3" if current else "#555"), 2 if current else 1))
+        painter.setBrush(QColor("#1e3a5f" if current else "#2d2d2d"))
+        painter.drawRoundedRect(rect, 5, 5)
+        painter.setPen(QColor("white"))
+        painter.setFont(QFont("Segoe UI", 14))
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(CELL_SIZE + CELL_SPACING, CELL_SIZE + 2)
+
+
+# Returns the sequence view inside the container, creating it on first use. The
+# view only paints the cells that are scrolled into sight.
+def page_sequence_view(container_widget):
+    view = container_widget.findChild(QListView, "Page_Sequence_View")
+    if view is not None:
+        return view
+
+    layout = container_widget.layout()
+    if layout is None:
         layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
         container_widget.setLayout(layout)
-    else:
-        layout = container_widget.layout()
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-
-    # Add each number in its own styled QLabel square
-    for num in reference_string.split():
-        label = QLabel(num)
-        label.setFixedSize(40, 40)
-        label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet("background-color: #2d2d2d; border: 1px solid #555; border-radius: 5px; color: white;")
-        label.setFont(QFont("Segoe UI", 14))
-        layout.addWidget(label)
\ No newline at end of file
+
+    view = QListView(container_widget)
+    view.setObjectName("Page_Sequence_View")
+    view.setFlow(QListView.LeftToRight)
+    view.setWrapping(False)
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.Batched)
+    view.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setSelectionMode(QAbstractItemView.NoSelection)
+    view.setFocusPolicy(Qt.NoFocus)
+    view.setFrameShape(QFrame.NoFrame)
+    view.setStyleSheet("background: transparent;")
+    view.setItemDelegate(PageCellDelegate(view))
+    layout.addWidget(view)
+    return view
+
+
+def display_page_sequence(container_widget, reference_string):
+    view = page_sequence_view(container_widget)
+    old_model = view.model()
+    view.setModel(PageSequenceModel(reference_string, view))
+    if old_model is not None:
+        old_model.deleteLater()
+
+
+# Highlights the reference at the given position and scrolls it into view.
+def highlight_page(container_widget, index):
+    view = page_sequence_view(container_widget)
+    model = view.model()
+    if model is None or not 0 <= index < model.rowCount():
+        return
+    model.set_current(index)
+    view.scrollTo(model.index(index), QAbstractItemView.PositionAtCenter)
+
+
+# Empties the sequence display.
+def clear_page_sequence(container_widget):
+    display_page_sequence(container_widget, "")
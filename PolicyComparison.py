@@ -0,0 +1,106 @@
+import argparse
+import json
+import sys
+from array import array
+
+from PageInterner import ID_TYPECODE, PageInterner
+from SimulationEngine import ENGINES, next_use_positions
+from SimulatorCli import positive_int
+from TraceReader import DEFAULT_CHUNK_SIZE, read_interned_chunks
+
+COMPARISON_FIELDS = ["policy", "frames", "faults", "hits", "references", "hit_ratio"]
+
+
+# Returns an engine for each policy name.
+def create_engines(policies, max_frames):
+    if max_frames < 1:
+        raise ValueError("Frame count must be at least 1")
+    for policy in policies:
+        if policy not in ENGINES:
+            raise ValueError(f"Unknown policy: {policy}")
+    return [ENGINES[policy](max_frames) for policy in policies]
+
+
+# Runs several policies over one reference string in lockstep: the trace is
+# walked once, chunk by chunk, and every engine consumes each chunk before the
+# next is taken. Optimal's next-use index is built once and shared. Returns one
+# row per policy in the order given.
+def compare_policies(reference_string, policies, max_frames, chunk_size=DEFAULT_CHUNK_SIZE):
+    if not hasattr(reference_string, "__getitem__"):
+        reference_string = list(reference_string)
+    engines = create_engines(policies, max_frames)
+
+    next_use = None
+    for engine in engines:
+        engine.reset()
+        if engine.offline:
+            if next_use is None:
+                next_use = next_use_positions(reference_string)
+            engine.prepare(reference_string, next_use)
+
+    for start in range(0, len(reference_string), chunk_size):
+        chunk = reference_string[start:start + chunk_size]
+        for engine in engines:
+            engine.feed(chunk)
+    return [comparison_row(engine, len(reference_string)) for engine in engines]
+
+
+# Same as compare_policies, but over an iterable of chunks so the trace never
+# has to be in memory. Offline policies such as Optimal are not supported.
+def compare_policies_streaming(chunks, policies, max_frames):
+    engines = create_engines(policies, max_frames)
+    for engine in engines:
+        if engine.offline:
+            raise ValueError(f"{engine.name} needs the whole reference string up front")
+
+    references = 0
+    for chunk in chunks:
+        references += len(chunk)
+        for engine in engines:
+            engine.feed(chunk)
+    return [comparison_row(engine, references) for engine in engines]
+
+
+# Returns the result row of an engine that has consumed a trace.
+def comparison_row(engine, references):
+    hits = references - engine.page_faults
+    return {
+        "policy": engine.name,
+        "frames": engine.max_frames,
+        "faults": engine.page_faults,
+        "hits": hits,
+        "references": references,
+        "hit_ratio": hits / references if references else 0.0,
+    }
+
+
+# Formats comparison rows as an aligned text table.
+def format_comparison(rows):
+    lines = [f"{'policy':<14} {'frames':>8} {'faults':>12} {'hits':>12} {'hit ratio':>10}"]
+    for row in rows:
+        lines.append(f"{row['policy']:<14} {row['frames']:>8} {row['faults']:>12} "
+                     f"{row['hits']:>12} {row['hit_ratio']:>10.4f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare policies side by side over one trace.")
+    parser.add_argument("trace", help="text trace file, or - for stdin")
+    parser.add_argument("--policies", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--frames", type=positive_int, required=True)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    chunks = read_interned_chunks(args.trace, PageInterner())
+    if any(ENGINES[policy].offline for policy in args.policies):
+        trace = array(ID_TYPECODE)
+        for chunk in chunks:
+            trace.extend(chunk)
+        rows = compare_policies(trace, args.policies, args.frames)
+    else:
+        rows = compare_policies_streaming(chunks, args.policies, args.frames)
+    if args.json:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_comparison(rows))
@@ -0,0 +1,121 @@
+from FrameBoxes import ADDED, HIT, REMOVED, FrameBoxPool
+from PageInterner import PageInterner
+from PageSequenceDisplay import clear_page_sequence, highlight_page
+from SimulationEngine import ENGINES
+from SimulationTimeline import SimulationTimeline
+
+class PolicySimulator:
+    # Initializes a simulator for any registered policy with the UI object.
+    def __init__(self, ui, algorithm):
+        self.ui = ui
+        self.engine_class = ENGINES[algorithm]
+        self.timeline = None
+        self.interner = PageInterner()
+        self.reference_string = []
+        self.max_frames = 0
+        self.current_index = 0
+        self.page_faults = 0
+
+    # Starts the simulation with the given reference string and number of frames.
+    def start(self, reference_string, max_frames):
+        self.interner = PageInterner()
+        self.reference_string = self.interner.intern_all(reference_string.split())
+        self.max_frames = max_frames
+        self.timeline = SimulationTimeline(self.engine_class, self.reference_string, max_frames)
+        self.current_index = 0
+        self.page_faults = 0
+        self.ui.Hit_Miss_Line_Edit.setText("")
+        self.ui.Page_Faults_Line_Edit.setText("")
+        self.clear_layouts()
+        self.ui.Completion_Label.setVisible(False)
+        self.process_current_page()
+
+    # Processes the next page in the reference string.
+    def next(self):
+        self.current_index += 1
+        if self.current_index < len(self.reference_string):
+            self.process_current_page()
+        else:
+            self.ui.Completion_Label.setVisible(True)
+
+    # Steps back to the previous page in the reference string.
+    def previous(self):
+        self.seek(min(self.current_index, len(self.reference_string)) - 1)
+
+    # Jumps to any page in the reference string.
+    def seek(self, index):
+        if 0 <= index < len(self.reference_string):
+            self.current_index = index
+            self.ui.Completion_Label.setVisible(False)
+            self.process_current_page()
+
+    # Processes the current page based on the selected policy.
+    def process_current_page(self):
+        self.render_step(self.current_index, self.timeline.step(self.current_index))
+
+    # Renders a step of the timeline, whether computed here or by autoplay.
+    def render_step(self, index, step):
+        self.current_index = index
+        page = self.reference_string[index]
+        labels = self.interner.labels
+        highlight_page(self.ui.Page_Sequence_Container, index)
+
+        result, old_frames, new_frames, self.page_faults = step
+        hit = result.hit
+
+        # Visualize Current Frame (before update)
+        boxes = []
+        for f in old_frames:
+            if not hit and f == result.evicted:
+                boxes.append((labels[f], REMOVED))
+            elif hit and f == page:
+                boxes.append((labels[f], HIT))
+            else:
+                boxes.append((labels[f], None))
+        self.show_boxes(self.ui.Current_Process, boxes)
+
+        # Added Page view
+        self.show_boxes(self.ui.Added_Page, [(labels[page], None)])
+
+        # Visualize New Frame (after update)
+        boxes = []
+        for f in new_frames:
+            if not hit and f == page:
+                boxes.append((labels[f], ADDED))
+            elif hit and f == page:
+                boxes.append((labels[f], HIT))
+            else:
+                boxes.append((labels[f], None))
+        self.show_boxes(self.ui.New_Process, boxes)
+
+        # Update status
+        self.ui.Hit_Miss_Line_Edit.setText("HIT" if hit else "MISS")
+        self.ui.Page_Faults_Line_Edit.setText(str(self.page_faults))
+
+    # Clears the layouts of the UI components.
+    def clear_layouts(self):
+        for frame in (self.ui.Current_Process, self.ui.Added_Page, self.ui.New_Process):
+            FrameBoxPool.for_frame(frame).clear()
+
+    # Shows the given (text, role) boxes in a frame, reusing its pooled labels.
+    def show_boxes(self, frame, boxes):
+        FrameBoxPool.for_frame(frame).show_boxes(boxes)
+
+    # Clears the simulation and resets the UI.
+    def clear_simulation(self):
+        self.interner = PageInterner()
+        self.reference_string = []
+        self.timeline = None
+        self.max_frames = 0
+        self.current_index = 0
+        self.page_faults = 0
+
+        self.clear_layouts()
+        clear_page_sequence(self.ui.Page_Sequence_Container)
+        self.ui.Hit_Miss_Line_Edit.setText("")
+        self.ui.Page_Faults_Line_Edit.setText("")
+        self.ui.Reference_String_Line_Edit.setText("")
+        self.ui.Length_Line_Edit.setText("")
+        self.ui.Frame_Line_Edit.setText("")
+        self.ui.Completion_Label.setVisible(False)
+        self.ui.Algorithm_Line_Edit.setText("")
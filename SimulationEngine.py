@@ -0,0 +1,794 @@
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from heapq import heapify, heappop, heappush
+
+# Record of a single reference: the page, whether it hit, the evicted page (None
+# when nothing was evicted) with the slot it was taken from, and the slot the
+# referenced page occupies once the step is applied.
+StepResult = namedtuple("StepResult", ["page", "hit", "evicted", "evicted_slot", "slot"])
+
+
+# Returns, for every position, where the same page is referenced next. Pages that
+# are never referenced again get len(reference_string), so for Optimal they all
+# tie and fall back to the oldest-by-age rule. Sequences such as arrays or
+# memoryviews over a mapped trace are indexed in place, not copied.
+def next_use_positions(reference_string):
+    if not hasattr(reference_string, "__getitem__"):
+        reference_string = list(reference_string)
+    never = len(reference_string)
+    next_use = array("q", [never]) * never
+    last_seen = {}
+    for i in range(never - 1, -1, -1):
+        page = reference_string[i]
+        next_use[i] = last_seen.get(page, never)
+        last_seen[page] = i
+    return next_use
+
+
+class ReplacementEngine:
+    name = None
+    offline = False  # True when prepare() must see the whole reference string
+    stats = None  # EngineStats while instrumentation is enabled
+    repeat_safe = False  # True when re-referencing the page just referenced never changes state
+
+    # Initializes the engine with the number of frames available.
+    def __init__(self, max_frames):
+        self.max_frames = max_frames
+        self.reset()
+
+    # Resets the frame state and the fault counter.
+    def reset(self):
+        self.frames = []
+        self.slots = {}  # Slot of each resident page, for policies that replace in place
+        self.page_faults = 0
+        if self.stats is not None:
+            self.stats.clear()
+
+    # Starts collecting EngineStats in feed() and count_faults(). Engines that
+    # never enable them pay nothing per reference.
+    def enable_stats(self):
+        from EngineStats import EngineStats
+        self.stats = EngineStats(self)
+
+    # Stops collecting EngineStats.
+    def disable_stats(self):
+        self.stats = None
+
+    # Returns engine-specific sizes worth tracking as maxima, or None.
+    def gauges(self):
+        return None
+
+    # Hook for policies that need to see the whole reference string up front.
+    def prepare(self, reference_string):
+        pass
+
+    # Applies one reference to the frames and returns its StepResult.
+    def step(self, page):
+        raise NotImplementedError
+
+    # Returns the StepResult of a hit on a resident page.
+    def hit(self, page):
+        return StepResult(page, True, None, None, self.slots[page])
+
+    # Records a fault and places the page in a free slot, or in the slot of the
+    # victim when one is given.
+    def admit(self, page, victim=None):
+        self.page_faults += 1
+        slots = self.slots
+        if victim is None:
+            slot = len(self.frames)
+            self.frames.append(page)
+            slots[page] = slot
+            return StepResult(page, False, None, None, slot)
+        slot = slots.pop(victim)
+        self.frames[slot] = page
+        slots[page] = slot
+        return StepResult(page, False, victim, slot, slot)
+
+    # Returns the reference string in a form prepare() and the step loop can
+    # both read: offline engines turn a one-shot iterator into a list once.
+    def whole_reference_string(self, reference_string):
+        if self.offline and not hasattr(reference_string, "__getitem__"):
+            return list(reference_string)
+        return reference_string
+
+    # Yields a StepResult for each page of the reference string.
+    def steps(self, reference_string):
+        reference_string = self.whole_reference_string(reference_string)
+        self.reset()
+        self.prepare(reference_string)
+        step = self.step
+        for page in reference_string:
+            yield step(page)
+
+    # Runs the whole reference string and returns the list of StepResults.
+    def run(self, reference_string):
+        return list(self.steps(reference_string))
+
+    # Applies a batch of references on top of the current state and returns the
+    # running fault count, so long traces can be fed in chunks.
+    def feed(self, pages):
+        if self.stats is not None:
+            return self.stats.feed(self, pages)
+        step = self.step
+        for page in pages:
+            step(page)
+        return self.page_faults
+
+    # Runs the whole reference string and returns only the number of faults.
+    def count_faults(self, reference_string):
+        reference_string = self.whole_reference_string(reference_string)
+        self.reset()
+        self.prepare(reference_string)
+        return self.feed(reference_string)
+
+
+class FifoEngine(ReplacementEngine):
+    name = "FIFO"
+    repeat_safe = True
+
+    # Resets the arrival queue and the residency set. Arrival numbers give the
+    # slot of a resident page without scanning the queue.
+    def reset(self):
+        super().reset()
+        self.frames = deque()
+        self.resident = set()
+        self.arrivals = {}
+        self.evictions = 0
+
+    # Evicts the page that has been resident the longest.
+    def step(self, page):
+        if page in self.resident:
+            return StepResult(page, True, None, None, self.arrivals[page] - self.evictions)
+
+        self.page_faults += 1
+        removed_page = None
+        evicted_slot = None
+        if len(self.frames) >= self.max_frames:
+            removed_page = self.frames.popleft()
+            self.resident.discard(removed_page)
+            del self.arrivals[removed_page]
+            self.evictions += 1
+            evicted_slot = 0
+        self.frames.append(page)
+        self.resident.add(page)
+        self.arrivals[page] = self.evictions + len(self.frames) - 1
+        return StepResult(page, False, removed_page, evicted_slot, len(self.frames) - 1)
+
+    # Applies a batch of references without building StepResults.
+    def feed(self, pages):
+        if self.stats is not None:
+            return self.stats.feed(self, pages)
+        frames = self.frames
+        resident = self.resident
+        arrivals = self.arrivals
+        max_frames = self.max_frames
+        faults = self.page_faults
+        evictions = self.evictions
+        for page in pages:
+            if page in resident:
+                continue
+            faults += 1
+            if len(frames) >= max_frames:
+                removed_page = frames.popleft()
+                resident.discard(removed_page)
+                del arrivals[removed_page]
+                evictions += 1
+            arrivals[page] = evictions + len(frames)
+            frames.append(page)
+            resident.add(page)
+
+        self.page_faults = faults
+        self.evictions = evictions
+        return faults
+
+
+class LruEngine(ReplacementEngine):
+    name = "LRU"
+    repeat_safe = True
+
+    # Resets the frames and the recency order. The recency map is ordered from
+    # least to most recently used and maps each resident page to its slot.
+    def reset(self):
+        super().reset()
+        self.recency = OrderedDict()
+
+    # Evicts the least recently used page, replacing it in place.
+    def step(self, page):
+        recency = self.recency
+        slot = recency.get(page)
+        if slot is not None:
+            recency.move_to_end(page)
+            return StepResult(page, True, None, None, slot)
+
+        self.page_faults += 1
+        if len(recency) < self.max_frames:
+            slot = len(self.frames)
+            self.frames.append(page)
+            recency[page] = slot
+            return StepResult(page, False, None, None, slot)
+
+        lru, slot = recency.popitem(last=False)
+        self.frames[slot] = page
+        recency[page] = slot
+        return StepResult(page, False, lru, slot, slot)
+
+
+class OptimalEngine(ReplacementEngine):
+    name = "OPTIMAL"
+    offline = True
+    repeat_safe = True
+
+    # Resets the frames, the frame ages and the position in the reference string.
+    def reset(self):
+        super().reset()
+        self.next_use = []
+        self.slots = {}
+        self.frame_ages = {}  # Track addition order as age per frame page
+        self.age_counter = 0
+        self.current_index = 0
+        self.page_next_use = {}  # Next reference position of each resident page
+        self.heap = []  # (-next use, age, page) entries, stale ones are skipped lazily
+
+    # Takes the next-use positions of the reference string, computing them unless
+    # the caller already has them (see next_use_positions).
+    def prepare(self, reference_string, next_use=None):
+        if next_use is None:
+            next_use = next_use_positions(reference_string)
+        self.next_use = next_use
+        self.current_index = 0
+
+    # Reports the size of the next-use heap, stale entries included.
+    def gauges(self):
+        return {"heap_size": len(self.heap)}
+
+    # Evicts the page whose next use lies furthest in the future.
+    def step(self, page):
+        index = self.current_index
+        self.current_index = index + 1
+        upcoming = self.next_use[index]
+        slots = self.slots
+
+        slot = slots.get(page)
+        if slot is not None:
+            self.page_next_use[page] = upcoming
+            self.push(page, upcoming)
+            return StepResult(page, True, None, None, slot)
+
+        self.page_faults += 1
+        to_replace = None
+        if len(slots) < self.max_frames:
+            slot = len(self.frames)
+            self.frames.append(page)
+        else:
+            to_replace = self.get_optimal_replacement()
+            slot = slots.pop(to_replace)
+            self.frames[slot] = page
+            del self.frame_ages[to_replace]
+            del self.page_next_use[to_replace]
+
+        slots[page] = slot
+        self.frame_ages[page] = self.age_counter
+        self.age_counter += 1
+        self.page_next_use[page] = upcoming
+        self.push(page, upcoming)
+        if to_replace is None:
+            return StepResult(page, False, None, None, slot)
+        return StepResult(page, False, to_replace, slot, slot)
+
+    # Records the next use of a resident page, compacting the heap once stale
+    # entries outnumber live ones so it stays O(frames) in size.
+    def push(self, page, upcoming):
+        heap = self.heap
+        heappush(heap, (-upcoming, self.frame_ages[page], page))
+        if len(heap) > 2 * self.max_frames + 16:
+            ages = self.frame_ages
+            self.heap = [(-nxt, ages[p], p) for p, nxt in self.page_next_use.items()]
+            heapify(self.heap)
+
+    # Determines the optimal page to replace: the resident page with the furthest
+    # next use, ties (pages never used again) going to the oldest by frame age.
+    def get_optimal_replacement(self):
+        heap = self.heap
+        page_next_use = self.page_next_use
+        ages = self.frame_ages
+        while True:
+            neg_next, age, page = heappop(heap)
+            if page_next_use.get(page) == -neg_next and ages.get(page) == age:
+                return page
+
+
+class ClockEngine(ReplacementEngine):
+    name = "CLOCK"
+    repeat_safe = True
+
+    # Resets the circular buffer of reference bits and the clock hand. The
+    # frames list itself is the circular buffer.
+    def reset(self):
+        super().reset()
+        self.referenced = []
+        self.hand = 0
+
+    # Sweeps the hand past referenced pages, clearing their bit, and evicts the
+    # first page found with the bit clear.
+    def step(self, page):
+        slot = self.slots.get(page)
+        if slot is not None:
+            self.referenced[slot] = True
+            return StepResult(page, True, None, None, slot)
+
+        if len(self.frames) < self.max_frames:
+            self.referenced.append(True)
+            return self.admit(page)
+
+        referenced = self.referenced
+        hand = self.hand
+        while referenced[hand]:
+            referenced[hand] = False
+            hand = (hand + 1) % self.max_frames
+        self.hand = (hand + 1) % self.max_frames
+        referenced[hand] = True
+        return self.admit(page, self.frames[hand])
+
+
+class SecondChanceEngine(ReplacementEngine):
+    name = "SECOND_CHANCE"
+    repeat_safe = True
+
+    # Resets the FIFO queue and the set of pages whose reference bit is set.
+    def reset(self):
+        super().reset()
+        self.queue = deque()
+        self.referenced = set()
+
+    # Takes pages from the head of the FIFO queue, sending referenced ones to
+    # the back with their bit cleared, until an unreferenced one is found. Like
+    # Clock, a page's bit is set when it is loaded.
+    def step(self, page):
+        if page in self.slots:
+            self.referenced.add(page)
+            return self.hit(page)
+
+        victim = None
+        if len(self.queue) >= self.max_frames:
+            queue = self.queue
+            referenced = self.referenced
+            while True:
+                candidate = queue.popleft()
+                if candidate in referenced:
+                    referenced.discard(candidate)
+                    queue.append(candidate)
+                else:
+                    victim = candidate
+                    break
+        self.queue.append(page)
+        self.referenced.add(page)
+        return self.admit(page, victim)
+
+
+class LfuEngine(ReplacementEngine):
+    name = "LFU"
+
+    # Resets the use counts, the aging offset and the priority heap.
+    def reset(self):
+        super().reset()
+        self.counts = {}
+        self.entries = {}  # Current (priority, sequence, page) heap entry of each page
+        self.age = 0  # Priority of the last victim, added to every new priority
+        self.sequence = 0
+        self.heap = []  # Stale entries are skipped lazily
+
+    # Evicts the page with the lowest priority, its use count plus the aging
+    # offset at its last use (LFU with dynamic aging). Ties go to the page used
+    # longest ago. Because the offset grows with every eviction, pages that were
+    # popular long ago eventually lose to recently popular ones.
+    def step(self, page):
+        if page in self.slots:
+            self.touch(page, self.counts[page] + 1)
+            return self.hit(page)
+
+        victim = None
+        if len(self.slots) >= self.max_frames:
+            victim = self.pop_victim()
+        result = self.admit(page, victim)
+        self.touch(page, 1)
+        return result
+
+    # Updates the use count of a resident page and queues its new priority.
+    def touch(self, page, count):
+        self.counts[page] = count
+        self.sequence += 1
+        entry = (count + self.age, self.sequence, page)
+        self.entries[page] = entry
+        heappush(self.heap, entry)
+        if len(self.heap) > 2 * self.max_frames + 16:
+            self.heap = list(self.entries.values())
+            heapify(self.heap)
+
+    # Pops the resident page with the lowest current priority.
+    def pop_victim(self):
+        entries = self.entries
+        while True:
+            entry = heappop(self.heap)
+            page = entry[2]
+            if entries.get(page) == entry:
+                del entries[page]
+                del self.counts[page]
+                self.age = entry[0]
+                return page
+
+
+class MruEngine(ReplacementEngine):
+    name = "MRU"
+    repeat_safe = True
+
+    # Resets the recency order, least recently used first.
+    def reset(self):
+        super().reset()
+        self.recency = OrderedDict()
+
+    # Evicts the most recently used page.
+    def step(self, page):
+        if page in self.recency:
+            self.recency.move_to_end(page)
+            return self.hit(page)
+
+        victim = None
+        if len(self.recency) >= self.max_frames:
+            victim, _ = self.recency.popitem(last=True)
+        self.recency[page] = None
+        return self.admit(page, victim)
+
+
+class ArcEngine(ReplacementEngine):
+    name = "ARC"
+
+    # Resets the four ARC lists: T1/T2 hold resident pages seen once / at least
+    # twice, B1/B2 are their ghost lists of recently evicted pages. target is
+    # the adaptive size T1 aims for.
+    def reset(self):
+        super().reset()
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.target = 0
+
+    # Adaptive Replacement Cache (Megiddo and Modha).
+    def step(self, page):
+        t1, t2, b1, b2 = self.t1, self.t2, self.b1, self.b2
+        capacity = self.max_frames
+
+        if page in t1:
+            del t1[page]
+            t2[page] = None
+            return self.hit(page)
+        if page in t2:
+            t2.move_to_end(page)
+            return self.hit(page)
+
+        victim = None
+        if page in b1:
+            self.target = min(capacity, self.target + max(len(b2) // len(b1), 1))
+            victim = self.replace(page)
+            del b1[page]
+            t2[page] = None
+        elif page in b2:
+            self.target = max(0, self.target - max(len(b1) // len(b2), 1))
+            victim = self.replace(page)
+            del b2[page]
+            t2[page] = None
+        else:
+            if len(t1) + len(b1) == capacity:
+                if len(t1) < capacity:
+                    b1.popitem(last=False)
+                    victim = self.replace(page)
+                else:
+                    victim, _ = t1.popitem(last=False)
+            elif len(t1) + len(b1) < capacity:
+                total = len(t1) + len(t2) + len(b1) + len(b2)
+                if total >= capacity:
+                    if total == 2 * capacity:
+                        b2.popitem(last=False)
+                    victim = self.replace(page)
+            t1[page] = None
+        return self.admit(page, victim)
+
+    # Moves the LRU page of T1 or T2 to its ghost list and returns it, or
+    # returns None while there are still free frames.
+    def replace(self, page):
+        if len(self.t1) + len(self.t2) < self.max_frames:
+            return None
+        if self.t1 and (len(self.t1) > self.target or (page in self.b2 and len(self.t1) == self.target)):
+            victim, _ = self.t1.popitem(last=False)
+            self.b1[victim] = None
+        else:
+            victim, _ = self.t2.popitem(last=False)
+            self.b2[victim] = None
+        return victim
+
+
+class TwoQueueEngine(ReplacementEngine):
+    name = "2Q"
+
+    # Resets the three 2Q queues: A1in is a FIFO of pages seen once, A1out a
+    # ghost FIFO of pages recently evicted from A1in, and Am an LRU of pages
+    # seen again while remembered in A1out.
+    def reset(self):
+        super().reset()
+        self.a1in = OrderedDict()
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()
+        self.in_size = max(1, self.max_frames // 4)
+        self.out_size = max(1, self.max_frames // 2)
+
+    # Full 2Q (Johnson and Shasha).
+    def step(self, page):
+        if page in self.am:
+            self.am.move_to_end(page)
+            return self.hit(page)
+        if page in self.a1in:
+            return self.hit(page)
+
+        remembered = page in self.a1out
+        victim = None
+        if len(self.a1in) + len(self.am) >= self.max_frames:
+            victim = self.reclaim()
+        if remembered:
+            self.a1out.pop(page, None)
+            self.am[page] = None
+        else:
+            self.a1in[page] = None
+        return self.admit(page, victim)
+
+    # Frees a frame: from A1in while it is over its share (remembering the page
+    # in A1out), otherwise from the LRU end of Am.
+    def reclaim(self):
+        if len(self.a1in) > self.in_size or not self.am:
+            victim, _ = self.a1in.popitem(last=False)
+            self.a1out[victim] = None
+            if len(self.a1out) > self.out_size:
+                self.a1out.popitem(last=False)
+            return victim
+        victim, _ = self.am.popitem(last=False)
+        return victim
+
+
+class LirsEngine(ReplacementEngine):
+    name = "LIRS"
+
+    # Resets the LIRS stack S (recency order, bottom first), the queue Q of
+    # resident HIR pages, and the set of LIR pages. About 1% of the frames, at
+    # least one, hold HIR pages. Non-resident HIR pages kept in S for their
+    # history are capped at twice the frame count.
+    def reset(self):
+        super().reset()
+        self.stack = OrderedDict()
+        self.queue = OrderedDict()
+        self.lir = set()
+        self.ghosts = OrderedDict()  # Non-resident HIR pages still in S, oldest first
+        self.hir_size = max(1, self.max_frames // 100)
+        self.lir_size = max(1, self.max_frames - self.hir_size)
+
+    # Low Inter-reference Recency Set (Jiang and Zhang).
+    def step(self, page):
+        stack, queue, lir = self.stack, self.queue, self.lir
+
+        if page in lir:
+            stack.move_to_end(page)
+            self.prune()
+            return self.hit(page)
+
+        if page in queue:
+            if page in stack:
+                # Its reuse distance beat the oldest LIR page: swap their status
+                stack.move_to_end(page)
+                del queue[page]
+                lir.add(page)
+                self.demote_bottom()
+            else:
+                stack[page] = None
+                queue.move_to_end(page)
+            return self.hit(page)
+
+        victim = None
+        if len(self.slots) >= self.max_frames:
+            if not queue:
+                self.demote_bottom()
+            victim, _ = queue.popitem(last=False)
+            if victim in stack:
+                self.ghosts[victim] = None
+                if len(self.ghosts) > 2 * self.max_frames:
+                    ghost, _ = self.ghosts.popitem(last=False)
+                    del stack[ghost]
+
+        if page in stack:
+            # A non-resident HIR page with a short reuse distance becomes LIR
+            del self.ghosts[page]
+            stack.move_to_end(page)
+            lir.add(page)
+            if len(lir) > self.lir_size:
+                self.demote_bottom()
+        elif len(lir) < self.lir_size and victim is None:
+            stack[page] = None
+            lir.add(page)
+        else:
+            stack[page] = None
+            queue[page] = None
+        return self.admit(page, victim)
+
+    # Turns the LIR page at the bottom of S into a resident HIR page.
+    def demote_bottom(self):
+        self.prune()
+        if not self.stack:
+            return
+        bottom, _ = self.stack.popitem(last=False)
+        self.lir.discard(bottom)
+        self.queue[bottom] = None
+        self.prune()
+
+    # Removes HIR pages from the bottom of S until an LIR page is there.
+    def prune(self):
+        stack = self.stack
+        while stack:
+            bottom = next(iter(stack))
+            if bottom in self.lir:
+                return
+            del stack[bottom]
+            self.ghosts.pop(bottom, None)
+
+
+class WorkingSetEngine(ReplacementEngine):
+    name = "WORKING_SET"
+
+    # Variable allocation: the resident set is exactly the pages referenced in
+    # the last window references. max_frames is the window, which also bounds
+    # the resident set. A hit can still release a page, so this engine is not
+    # registered with the fixed-allocation policies the UI replays.
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("The working set window must be at least 1")
+        self.window = window
+        super().__init__(window)
+
+    # Resets the last reference time of every page and the references inside
+    # the window, oldest first.
+    def reset(self):
+        super().reset()
+        self.time = 0
+        self.last_reference = {}
+        self.recent = deque()
+        self.resident_total = 0  # Sum of the resident set size after every step
+        self.peak_resident = 0
+
+    # References a page, then releases the page referenced window steps ago
+    # if it has not been referenced since. Only that one reference leaves the
+    # window per step, so nothing is rescanned. A released page is reported as
+    # evicted; the last frame moves into its slot.
+    def step(self, page):
+        now = self.time
+        self.time = now + 1
+        slots = self.slots
+        slot = slots.get(page)
+        hit = slot is not None
+        if not hit:
+            self.page_faults += 1
+            slot = len(self.frames)
+            self.frames.append(page)
+            slots[page] = slot
+        self.last_reference[page] = now
+        self.recent.append(page)
+
+        released = None
+        released_slot = None
+        if len(self.recent) > self.window:
+            oldest = self.recent.popleft()
+            if self.last_reference[oldest] == now - self.window:
+                del self.last_reference[oldest]
+                released = oldest
+                released_slot = self.release(oldest)
+                slot = slots[page]
+
+        resident = len(slots)
+        self.resident_total += resident
+        if resident > self.peak_resident:
+            self.peak_resident = resident
+        return StepResult(page, hit, released, released_slot, slot)
+
+    # Removes a page from the frames, filling its slot with the last frame, and
+    # returns the slot it occupied.
+    def release(self, page):
+        frames = self.frames
+        slot = self.slots.pop(page)
+        last = frames.pop()
+        if last != page:
+            frames[slot] = last
+            self.slots[last] = slot
+        return slot
+
+    # Returns the resident set size averaged over the references so far.
+    def average_resident(self):
+        return self.resident_total / self.time if self.time else 0.0
+
+
+class WsClockEngine(ReplacementEngine):
+    name = "WSCLOCK"
+
+    # Clock over a fixed frame pool that prefers pages outside the working set:
+    # each frame keeps a reference bit and the virtual time it was last seen
+    # referenced. window defaults to twice the frame count.
+    def __init__(self, max_frames, window=None):
+        self.window = 2 * max_frames if window is None else window
+        super().__init__(max_frames)
+
+    # Resets the reference bits, last-use times, hand and virtual time.
+    def reset(self):
+        super().reset()
+        self.referenced = []
+        self.last_use = []
+        self.hand = 0
+        self.time = 0
+
+    # Sweeps from the hand: referenced pages get their bit cleared and their
+    # last use moved to now, and the first unreferenced page older than the
+    # window is evicted. After a full turn without one, the first unreferenced
+    # page passed is taken, or the page under the hand if every bit was set.
+    def step(self, page):
+        now = self.time
+        self.time = now + 1
+        slot = self.slots.get(page)
+        if slot is not None:
+            self.referenced[slot] = True
+            return StepResult(page, True, None, None, slot)
+
+        if len(self.frames) < self.max_frames:
+            self.referenced.append(True)
+            self.last_use.append(now)
+            return self.admit(page)
+
+        referenced = self.referenced
+        last_use = self.last_use
+        max_frames = self.max_frames
+        hand = self.hand
+        fallback = None
+        for _ in range(max_frames):
+            if referenced[hand]:
+                referenced[hand] = False
+                last_use[hand] = now
+            elif now - last_use[hand] > self.window:
+                break
+            elif fallback is None:
+                fallback = hand
+            hand = (hand + 1) % max_frames
+        else:
+            if fallback is not None:
+                hand = fallback
+        self.hand = (hand + 1) % max_frames
+        referenced[hand] = True
+        last_use[hand] = now
+        return self.admit(page, self.frames[hand])
+
+
+# Engines by the algorithm name shown in the UI and accepted on the command line.
+ENGINES = {}
+
+
+# Adds an engine class to the registry under its name.
+def register_engine(engine_class):
+    ENGINES[engine_class.name] = engine_class
+    return engine_class
+
+
+for engine_class in (FifoEngine, LruEngine, OptimalEngine, ClockEngine, SecondChanceEngine,
+                     LfuEngine, MruEngine, ArcEngine, TwoQueueEngine, LirsEngine, WsClockEngine):
+    register_engine(engine_class)
+
+
+# Runs a policy over a reference string and returns the list of StepResults.
+def simulate(engine_class, reference_string, max_frames):
+    return engine_class(max_frames).run(reference_string)
+
+
+# Runs a policy over a reference string and returns the total number of faults.
+def count_faults(engine_class, reference_string, max_frames):
+    return engine_class(max_frames).count_faults(reference_string)
@@ -0,0 +1,114 @@
+from array import array
+from collections import namedtuple
+
+from SimulationEngine import StepResult
+
+DEFAULT_CHECKPOINT_INTERVAL = 256
+
+# Everything needed to draw one step: its StepResult, the frames before and
+# after it, and the number of faults up to and including it.
+TimelineStep = namedtuple("TimelineStep", ["result", "before", "after", "page_faults"])
+
+
+class SimulationTimeline:
+    # Runs a policy over the whole reference string once and keeps a compact
+    # event log (slot taken, slot evicted, running fault count) plus a copy of
+    # the frames every checkpoint_interval steps. Any step can then be rebuilt
+    # from the nearest earlier checkpoint. The interval is at least the frame
+    # count, so the checkpoints take about as much memory as the trace itself.
+    def __init__(self, engine_class, reference_string, max_frames,
+                 checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+        self.reference_string = reference_string
+        self.interval = max(checkpoint_interval, max_frames, 1)
+        self.slots = array("i")
+        self.evicted_slots = array("i")  # -1 when nothing was evicted
+        self.faults = array("q")
+        self.checkpoints = []  # frames before steps 0, interval, 2 * interval, ...
+
+        engine = engine_class(max_frames)
+        interval = self.interval
+        for index, result in enumerate(engine.steps(reference_string)):
+            if index % interval == 0:
+                self.checkpoints.append(self.frames_from_engine(engine, result))
+            self.slots.append(result.slot)
+            self.evicted_slots.append(-1 if result.evicted_slot is None else result.evicted_slot)
+            self.faults.append(engine.page_faults)
+
+        self.cursor = None  # (index, frames after that step) of the last lookup
+
+    # Returns the frames as they were before the step that produced result.
+    @staticmethod
+    def frames_from_engine(engine, result):
+        frames = list(engine.frames)
+        if not result.hit:
+            if result.evicted_slot == result.slot:
+                frames[result.slot] = result.evicted
+            else:
+                del frames[result.slot]
+                if result.evicted_slot is not None:
+                    frames.insert(result.evicted_slot, result.evicted)
+        return frames
+
+    # Returns the number of steps in the timeline.
+    def __len__(self):
+        return len(self.faults)
+
+    # Applies the recorded event of a step to the frames before it, in place,
+    # and returns the step's StepResult.
+    def apply(self, index, frames):
+        page = self.reference_string[index]
+        slot = self.slots[index]
+        previous_faults = self.faults[index - 1] if index else 0
+        if self.faults[index] == previous_faults:
+            return StepResult(page, True, None, None, slot)
+
+        evicted_slot = self.evicted_slots[index]
+        if evicted_slot < 0:
+            frames.insert(slot, page)
+            return StepResult(page, False, None, None, slot)
+        if evicted_slot == slot:
+            # Replaced in place, as most engines do; avoids shifting the list
+            evicted = frames[slot]
+            frames[slot] = page
+        else:
+            evicted = frames.pop(evicted_slot)
+            frames.insert(slot, page)
+        return StepResult(page, False, evicted, evicted_slot, slot)
+
+    # Returns the frames before a step, replaying at most one checkpoint
+    # interval of events. The returned list must not be modified.
+    def frames_before(self, index):
+        if self.cursor is not None and self.cursor[0] == index - 1:
+            return self.cursor[1]
+        checkpoint = index // self.interval
+        frames = list(self.checkpoints[checkpoint])
+        # Same events as apply, without building a StepResult per step
+        reference_string = self.reference_string
+        slots = self.slots
+        evicted_slots = self.evicted_slots
+        faults = self.faults
+        start = checkpoint * self.interval
+        previous_faults = faults[start - 1] if start else 0
+        for replay in range(start, index):
+            replay_faults = faults[replay]
+            if replay_faults != previous_faults:
+                previous_faults = replay_faults
+                slot = slots[replay]
+                evicted_slot = evicted_slots[replay]
+                if evicted_slot == slot:
+                    frames[slot] = reference_string[replay]
+                else:
+                    if evicted_slot >= 0:
+                        del frames[evicted_slot]
+                    frames.insert(slot, reference_string[replay])
+        return frames
+
+    # Returns the TimelineStep at a position.
+    def step(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("step out of range")
+        before = self.frames_before(index)
+        after = list(before)
+        result = self.apply(index, after)
+        self.cursor = (index, after)
+        return TimelineStep(result, before, after, self.faults[index])
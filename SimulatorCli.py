@@ -0,0 +1,234 @@
+import argparse
+import sys
+import time
+from array import array
+from contextlib import contextmanager
+
+from PageInterner import ID_TYPECODE, PageInterner
+from SimulationEngine import ENGINES, next_use_positions
+
+# Same columns as SweepRunner.RESULT_FIELDS; repeated here so startup does not
+# pay for importing the process pool.
+RESULT_FIELDS = ["trace", "policy", "frames", "faults", "references", "hit_ratio", "seconds"]
+# Engine counters added to each row with --stats; gauges become max_<name> columns
+STATS_FIELDS = ["hits", "evictions", "compulsory_faults", "capacity_faults", "ns_per_reference"]
+
+
+# argparse type for frame counts, which must be at least 1.
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+# Returns True if path is a file starting with the binary trace magic.
+def is_binary_trace(path):
+    if path == "-":
+        return False
+    from BinaryTrace import MAGIC
+    with open(path, "rb") as stream:
+        return stream.read(len(MAGIC)) == MAGIC
+
+
+# Loads a trace as an indexable sequence of page ids and its run lengths, which
+# are None unless the trace is run-length encoded, for the duration of a with
+# block. Binary traces are mapped and unmapped on exit, text traces (optionally
+# gzip/xz compressed, or - for stdin) are interned. Readers are imported here
+# so a --help run never loads them.
+@contextmanager
+def load_trace(path):
+    if is_binary_trace(path):
+        from BinaryTrace import BinaryTrace
+        with BinaryTrace(path) as trace:
+            yield trace.pages, trace.run_lengths
+        return
+
+    from TraceReader import read_interned_chunks
+    pages = array(ID_TYPECODE)
+    for chunk in read_interned_chunks(path, PageInterner()):
+        pages.extend(chunk)
+    yield pages, None
+
+
+# Runs every policy and frame count over one loaded trace and returns the rows.
+# Optimal's next-use index is built once per sequence and counted in its timing.
+# Engines with repeat_safe run on the collapsed pages of a run-length encoded
+# trace, or of any trace with collapse, and the others on the full trace; the
+# fault counts are exact either way. With stats, every engine is instrumented
+# and its counters join the row.
+def run_trace(label, pages, policies, frame_sizes, stats=False, run_lengths=None, collapse=False):
+    from TraceCompression import collapse_repeats, expand_runs, page_typecode
+
+    rows = []
+    short = pages
+    full = pages
+    if run_lengths is not None:
+        full = None  # Expanded only if an engine needs it
+        references = sum(run_lengths)
+    else:
+        references = len(pages)
+        if collapse:
+            short = collapse_repeats(pages)
+    next_use = {}  # Keyed by whether the sequence is the collapsed one
+    for policy in policies:
+        for frames in frame_sizes:
+            engine = ENGINES[policy](frames)
+            if stats:
+                engine.enable_stats()
+            if engine.repeat_safe:
+                sequence = short
+            else:
+                if full is None:
+                    full = array(page_typecode(pages))
+                    for chunk in expand_runs(pages, run_lengths):
+                        full.extend(chunk)
+                sequence = full
+            start = time.perf_counter()
+            engine.reset()
+            if engine.offline:
+                key = sequence is short
+                if key not in next_use:
+                    next_use[key] = next_use_positions(sequence)
+                engine.prepare(sequence, next_use[key])
+            engine.feed(sequence)
+            seconds = time.perf_counter() - start
+            rows.append(result_row(label, engine, references, len(sequence), seconds))
+    return rows
+
+
+# Runs online policies over a text trace read chunk by chunk, so only one chunk
+# is in memory whatever the trace size. Every (policy, frames) engine consumes
+# a chunk before the next is read. With collapse, repeat_safe engines are fed
+# each chunk with its consecutive repeats collapsed, including repeats that
+# straddle chunk borders.
+def stream_trace(label, chunks, policies, frame_sizes, stats=False, collapse=False):
+    from TraceCompression import collapse_chunk
+
+    engines = []
+    for policy in policies:
+        for frames in frame_sizes:
+            engine = ENGINES[policy](frames)
+            if stats:
+                engine.enable_stats()
+            engine.reset()
+            engines.append(engine)
+    collapsed = [collapse and engine.repeat_safe for engine in engines]
+    seconds = [0.0] * len(engines)
+    fed = [0] * len(engines)
+    references = 0
+    previous = None
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        references += len(chunk)
+        short = collapse_chunk(chunk, previous) if collapse else chunk
+        previous = chunk[-1]
+        for index, engine in enumerate(engines):
+            sequence = short if collapsed[index] else chunk
+            start = time.perf_counter()
+            engine.feed(sequence)
+            seconds[index] += time.perf_counter() - start
+            fed[index] += len(sequence)
+    return [result_row(label, engine, references, fed[index], seconds[index])
+            for index, engine in enumerate(engines)]
+
+
+# Returns the result row of an engine that has consumed a trace of references
+# references, fed of which it was actually given. With stats, the repeats it
+# was not fed are hits, and are added back so hits and ns_per_reference cover
+# every reference.
+def result_row(label, engine, references, fed, seconds):
+    faults = engine.page_faults
+    row = {
+        "trace": label,
+        "policy": engine.name,
+        "frames": engine.max_frames,
+        "faults": faults,
+        "references": references,
+        "hit_ratio": (references - faults) / references if references else 0.0,
+        "seconds": seconds,
+    }
+    if engine.stats is not None:
+        counters = engine.stats.as_dict()
+        counters["hits"] += references - fed
+        counters["ns_per_reference"] = counters["seconds"] / references * 1e9 if references else 0.0
+        for field in STATS_FIELDS:
+            row[field] = counters[field]
+        for name, value in counters["gauges"].items():
+            row[f"max_{name}"] = value
+    return row
+
+
+# Runs all combinations in this process and returns the rows in trace, policy,
+# frames order. Text traces are streamed unless an offline policy such as
+# Optimal needs the whole reference string.
+def run_batch(trace_paths, policies, frame_sizes, stats=False, collapse=False):
+    for policy in policies:
+        if policy not in ENGINES:
+            raise ValueError(f"Unknown policy: {policy}")
+    offline = any(ENGINES[policy].offline for policy in policies)
+    rows = []
+    for path in trace_paths:
+        if not offline and not is_binary_trace(path):
+            from TraceReader import read_interned_chunks
+            chunks = read_interned_chunks(path, PageInterner())
+            rows.extend(stream_trace(path, chunks, policies, frame_sizes, stats, collapse))
+            continue
+        with load_trace(path) as (pages, run_lengths):
+            rows.extend(run_trace(path, pages, policies, frame_sizes, stats, run_lengths, collapse))
+    return rows
+
+
+# Writes result rows in the requested format.
+def write_rows(rows, stream, output_format):
+    if output_format == "csv":
+        import csv
+        fieldnames = list(RESULT_FIELDS)
+        for row in rows:
+            fieldnames.extend(field for field in row if field not in fieldnames)
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        import json
+        json.dump(rows, stream, indent=2)
+        stream.write("\n")
+
+
+# Parses the command line, runs the batch and writes the results.
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m SimulatorCli",
+        description="Run page replacement policies over traces without the GUI.")
+    parser.add_argument("traces", nargs="+", help="text, compressed text or binary trace files; - for stdin")
+    parser.add_argument("--policies", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--frames", nargs="+", type=positive_int, required=True)
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output", default="-", help="file to write the results to, - for stdout")
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="run jobs on this many processes instead of in-process")
+    parser.add_argument("--collapse", action="store_true",
+                        help="collapse consecutive repeats for engines where that keeps faults exact")
+    parser.add_argument("--stats", action="store_true",
+                        help="instrument the engines and add their counters to each row")
+    args = parser.parse_args(argv)
+    if args.stats and args.workers is not None:
+        parser.error("--stats is only supported in-process, without --workers")
+
+    if args.workers is not None:
+        from SweepRunner import run_sweep
+        rows = run_sweep(args.traces, args.policies, args.frames, args.workers, args.collapse)
+    else:
+        rows = run_batch(args.traces, args.policies, args.frames, args.stats, args.collapse)
+
+    if args.output == "-":
+        write_rows(rows, sys.stdout, args.format)
+    else:
+        with open(args.output, "w", newline="") as stream:
+            write_rows(rows, stream, args.format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
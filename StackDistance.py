@@ -0,0 +1,124 @@
+import argparse
+import csv
+import json
+import sys
+from array import array
+
+CURVE_FIELDS = ["frames", "faults", "miss_ratio"]
+
+
+class FenwickTree:
+    # Binary indexed tree of counts over positions 0..size-1.
+    def __init__(self, size):
+        self.size = size
+        self.tree = array("l", [0]) * (size + 1)
+
+    # Adds delta to the count at a position.
+    def add(self, position, delta):
+        tree = self.tree
+        size = self.size
+        i = position + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    # Returns the sum of the counts at positions 0..position-1.
+    def prefix_sum(self, position):
+        tree = self.tree
+        total = 0
+        i = position
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+# Yields the LRU stack distance of every reference: the number of distinct pages
+# touched since the previous reference to the same page, counting the page
+# itself, or None on the first reference. The tree marks the latest access time
+# of every page, so each distance is one prefix-sum query, O(n log n) overall.
+def stack_distances(reference_string):
+    if not hasattr(reference_string, "__len__"):
+        reference_string = list(reference_string)
+    tree = FenwickTree(len(reference_string))
+    last_access = {}
+    marked = 0
+    for time, page in enumerate(reference_string):
+        previous = last_access.get(page)
+        if previous is None:
+            yield None
+            marked += 1
+        else:
+            yield marked - tree.prefix_sum(previous)
+            tree.add(previous, -1)
+        tree.add(time, 1)
+        last_access[page] = time
+
+
+# Returns the number of LRU faults for every frame count from 1 to max_frames in
+# one pass; faults[k - 1] is the count for k frames. max_frames defaults to the
+# number of distinct pages, beyond which the count no longer changes.
+def lru_fault_counts(reference_string, max_frames=None):
+    histogram = {}
+    cold_misses = 0
+    for distance in stack_distances(reference_string):
+        if distance is None:
+            cold_misses += 1
+        else:
+            histogram[distance] = histogram.get(distance, 0) + 1
+
+    if max_frames is None:
+        max_frames = cold_misses
+
+    # A reference hits with k frames exactly when its stack distance is <= k
+    faults = []
+    remaining = cold_misses + sum(histogram.values())
+    for frames in range(1, max_frames + 1):
+        remaining -= histogram.get(frames, 0)
+        faults.append(remaining)
+    return faults
+
+
+# Returns (frames, faults, miss ratio) rows of the LRU miss-ratio curve.
+def miss_ratio_curve(reference_string, max_frames=None):
+    if not hasattr(reference_string, "__len__"):
+        reference_string = list(reference_string)
+    total = len(reference_string)
+    faults = lru_fault_counts(reference_string, max_frames)
+    return [(frames, count, count / total if total else 0.0)
+            for frames, count in enumerate(faults, start=1)]
+
+
+# Writes a miss-ratio curve as CSV with a header row.
+def write_curve_csv(curve, stream):
+    writer = csv.writer(stream)
+    writer.writerow(CURVE_FIELDS)
+    writer.writerows(curve)
+
+
+# Writes a miss-ratio curve as a JSON list of objects.
+def write_curve_json(curve, stream):
+    json.dump([dict(zip(CURVE_FIELDS, row)) for row in curve], stream, indent=2)
+    stream.write("\n")
+
+
+if __name__ == "__main__":
+    from PageInterner import ID_TYPECODE, PageInterner
+    from SimulatorCli import positive_int
+    from TraceReader import read_interned_chunks
+
+    parser = argparse.ArgumentParser(
+        description="Print the LRU fault count and miss ratio for every frame count.")
+    parser.add_argument("trace", help="text trace file, or - for stdin")
+    parser.add_argument("--max-frames", type=positive_int, default=None)
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    args = parser.parse_args()
+
+    trace = array(ID_TYPECODE)
+    for chunk in read_interned_chunks(args.trace, PageInterner()):
+        trace.extend(chunk)
+    curve = miss_ratio_curve(trace, args.max_frames)
+    if args.format == "json":
+        write_curve_json(curve, sys.stdout)
+    else:
+        write_curve_csv(curve, sys.stdout)
@@ -0,0 +1,142 @@
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from BinaryTrace import BinaryTrace, MAGIC, convert_text_trace
+from PageInterner import PageInterner
+from SimulationEngine import ENGINES, next_use_positions
+from SimulatorCli import positive_int
+from TraceCompression import collapse_repeats, page_typecode
+
+RESULT_FIELDS = ["trace", "policy", "frames", "faults", "references", "hit_ratio", "seconds"]
+
+# Traces, expanded run-length traces, collapsed traces and next-use arrays of
+# this worker process
+open_traces = {}
+expanded_traces = {}
+collapsed_traces = {}
+next_use_cache = {}
+
+
+# Returns the mapped trace at path, opening it once per worker. Every worker maps
+# the same file, so the pages are shared through the OS page cache instead of
+# being pickled into each task.
+def worker_trace(path):
+    trace = open_traces.get(path)
+    if trace is None:
+        trace = BinaryTrace(path)
+        open_traces[path] = trace
+    return trace
+
+
+# Returns the pages an engine must see: the stored pages, or for a run-length
+# encoded trace and an engine that is not repeat_safe, the expanded references.
+# With collapse, repeat_safe engines see a plain trace with its consecutive
+# repeats collapsed.
+def engine_pages(path, trace, engine, collapse=False):
+    if trace.run_lengths is None and collapse and engine.repeat_safe:
+        pages = collapsed_traces.get(path)
+        if pages is None:
+            pages = collapse_repeats(trace.pages)
+            collapsed_traces[path] = pages
+        return pages
+    if trace.run_lengths is None or engine.repeat_safe:
+        return trace.pages
+    pages = expanded_traces.get(path)
+    if pages is None:
+        pages = array(page_typecode(trace.pages))
+        for chunk in trace.reference_chunks():
+            pages.extend(chunk)
+        expanded_traces[path] = pages
+    return pages
+
+
+# Runs one (trace, policy, frames) job and returns its result row.
+def run_job(job):
+    path, label, policy, frames, collapse = job
+    trace = worker_trace(path)
+    engine = ENGINES[policy](frames)
+    pages = engine_pages(path, trace, engine, collapse)
+
+    start = time.perf_counter()
+    engine.reset()
+    if engine.offline:
+        key = (path, pages is trace.pages)
+        next_use = next_use_cache.get(key)
+        if next_use is None:
+            next_use = next_use_positions(pages)
+            next_use_cache[key] = next_use
+        engine.prepare(pages, next_use)
+    faults = engine.feed(pages)
+    seconds = time.perf_counter() - start
+
+    references = trace.references
+    hit_ratio = (references - faults) / references if references else 0.0
+    return {
+        "trace": label,
+        "policy": policy,
+        "frames": frames,
+        "faults": faults,
+        "references": references,
+        "hit_ratio": hit_ratio,
+        "seconds": seconds,
+    }
+
+
+# Returns True if the file starts with the binary trace magic.
+def is_binary_trace(path):
+    with open(path, "rb") as stream:
+        return stream.read(len(MAGIC)) == MAGIC
+
+
+# Runs every policy x frame size x trace combination on a process pool and
+# returns the result rows in job order. Text traces are converted to temporary
+# binary traces first so workers can map them. With collapse, repeat_safe
+# engines run on the traces with consecutive repeats collapsed.
+def run_sweep(trace_paths, policies, frame_sizes, workers=None, collapse=False):
+    for policy in policies:
+        if policy not in ENGINES:
+            raise ValueError(f"Unknown policy: {policy}")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        mapped = []
+        for index, path in enumerate(trace_paths):
+            if path != "-" and is_binary_trace(path):
+                mapped.append((path, path))
+            else:
+                binary_path = os.path.join(scratch, f"trace{index}.bin")
+                convert_text_trace(path, binary_path, interner=PageInterner())
+                mapped.append((binary_path, path))
+
+        jobs = [(binary_path, label, policy, frames, collapse)
+                for binary_path, label in mapped
+                for policy in policies
+                for frames in frame_sizes]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run_job, jobs))
+
+
+# Writes result rows as CSV.
+def write_results_csv(rows, stream):
+    writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a policy x frames x trace sweep in parallel.")
+    parser.add_argument("traces", nargs="+", help="text or binary trace files")
+    parser.add_argument("--policies", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--frames", nargs="+", type=positive_int, required=True)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--collapse", action="store_true",
+                        help="collapse consecutive repeats for engines where that keeps faults exact")
+    args = parser.parse_args()
+
+    write_results_csv(run_sweep(args.traces, args.policies, args.frames, args.workers, args.collapse),
+                      sys.stdout)
@@ -0,0 +1,106 @@
+from array import array, typecodes as ARRAY_TYPECODES
+from itertools import groupby
+
+from PageInterner import ID_TYPECODE
+from TraceReader import DEFAULT_CHUNK_SIZE
+
+# Longest run one run-length entry can hold; longer runs take several entries
+MAX_RUN_LENGTH = 0xFFFFFFFF
+RUN_LENGTH_TYPECODE = "I"
+
+
+# Returns the array typecode that holds the page ids of a sequence: the
+# typecode of an array, the format of a memoryview (8 bytes wide for some
+# binary traces), or ID_TYPECODE for lists and other iterables.
+def page_typecode(pages):
+    typecode = getattr(pages, "typecode", None) or getattr(pages, "format", None)
+    return typecode if typecode and typecode in ARRAY_TYPECODES else ID_TYPECODE
+
+
+# Returns the reference string with consecutive repeats of a page collapsed
+# into one reference. For engines with repeat_safe set, every dropped
+# reference would have been a hit that leaves the engine's state unchanged,
+# so the fault count on the collapsed string is exact.
+def collapse_repeats(reference_string):
+    return array(page_typecode(reference_string), [page for page, _ in groupby(reference_string)])
+
+
+# Returns one chunk with its consecutive repeats collapsed, also dropping a
+# leading repeat of previous, the last page of the chunk before.
+def collapse_chunk(chunk, previous=None):
+    pages = [page for page, _ in groupby(chunk)]
+    if pages and pages[0] == previous:
+        del pages[0]
+    return pages
+
+
+# Yields (pages, run lengths) lists for chunks of references. A run that
+# continues into the next chunk is only emitted once it ends, so runs are never
+# split at chunk borders, only when they outgrow MAX_RUN_LENGTH.
+def run_length_chunks(chunks):
+    current = None
+    length = 0
+    for chunk in chunks:
+        pages = []
+        counts = []
+        for page, group in groupby(chunk):
+            run = sum(1 for _ in group)
+            if length and page == current:
+                length += run
+                continue
+            if length:
+                append_run(pages, counts, current, length)
+            current = page
+            length = run
+        if pages:
+            yield pages, counts
+    if length:
+        pages = []
+        counts = []
+        append_run(pages, counts, current, length)
+        yield pages, counts
+
+
+# Appends a run, as several entries if it is longer than MAX_RUN_LENGTH.
+def append_run(pages, counts, page, length):
+    while length > MAX_RUN_LENGTH:
+        pages.append(page)
+        counts.append(MAX_RUN_LENGTH)
+        length -= MAX_RUN_LENGTH
+    pages.append(page)
+    counts.append(length)
+
+
+# Returns the collapsed pages and the length of every run as arrays.
+def run_length_encode(reference_string):
+    pages = []
+    counts = array(RUN_LENGTH_TYPECODE)
+    for chunk_pages, chunk_counts in run_length_chunks([reference_string]):
+        pages.extend(chunk_pages)
+        counts.extend(chunk_counts)
+    return array(page_typecode(reference_string), pages), counts
+
+
+# Yields the full reference string of a run-length encoded trace in chunks of
+# about chunk_size references.
+def expand_runs(pages, run_lengths, chunk_size=DEFAULT_CHUNK_SIZE):
+    chunk = []
+    for page, length in zip(pages, run_lengths):
+        while length:
+            take = min(length, chunk_size - len(chunk))
+            chunk.extend([page] * take)
+            length -= take
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+# Counts the faults of a policy on the collapsed reference string. Only
+# engines that declare repeat_safe are accepted, since for the others a repeat
+# can change state (a frequency count, an ARC list, a working-set window).
+def count_faults_collapsed(engine_class, reference_string, max_frames):
+    if not engine_class.repeat_safe:
+        raise ValueError(f"{engine_class.name} is not exact on collapsed traces")
+    return engine_class(max_frames).count_faults(collapse_repeats(reference_string))
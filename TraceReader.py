@@ -0,0 +1,65 @@
+import gzip
+import lzma
+import sys
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+DEFAULT_CHUNK_SIZE = 65536
+READ_BLOCK_SIZE = 1 << 20
+
+
+# Opens a trace for binary reading and returns (raw stream, decoded stream).
+# "-" reads from stdin; gzip and xz input is recognised by its magic bytes and
+# decompressed on the fly.
+def open_trace(path):
+    raw = sys.stdin.buffer if path == "-" else open(path, "rb")
+    magic = raw.peek(len(XZ_MAGIC))[:len(XZ_MAGIC)]
+    if magic.startswith(GZIP_MAGIC):
+        return raw, gzip.GzipFile(fileobj=raw, mode="rb")
+    if magic.startswith(XZ_MAGIC):
+        return raw, lzma.LZMAFile(raw, "rb")
+    return raw, raw
+
+
+# Yields the page references of a text trace in lists of at most chunk_size.
+# References may be one per line or separated by any whitespace; the file is
+# read in fixed-size blocks so memory stays bounded whatever the trace size.
+def read_trace_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    raw, stream = open_trace(path)
+    try:
+        pending = []
+        carry = b""
+        while True:
+            block = stream.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            block = carry + block
+
+            # Keep a token that may continue in the next block for later
+            cut = len(block)
+            while cut and not block[cut - 1:cut].isspace():
+                cut -= 1
+            carry = block[cut:]
+
+            pending.extend(block[:cut].decode().split())
+            full = len(pending) - len(pending) % chunk_size
+            for start in range(0, full, chunk_size):
+                yield pending[start:start + chunk_size]
+            del pending[:full]
+
+        pending.extend(carry.decode().split())
+        for start in range(0, len(pending), chunk_size):
+            yield pending[start:start + chunk_size]
+    finally:
+        if stream is not raw:
+            stream.close()
+        if raw is not sys.stdin.buffer:
+            raw.close()
+
+
+# Yields the references of a text trace as arrays of interned page ids, so each
+# reference costs four bytes instead of a string object.
+def read_interned_chunks(path, interner, chunk_size=DEFAULT_CHUNK_SIZE):
+    for chunk in read_trace_chunks(path, chunk_size):
+        yield interner.intern_all(chunk)
@@ -0,0 +1,85 @@
+import argparse
+import csv
+import sys
+from array import array
+
+CURVE_FIELDS = ["window", "faults", "fault_rate", "average_working_set"]
+
+
+# Returns the histograms a working-set curve is built from, in one pass:
+# gaps[g] counts references whose previous reference to the same page was g
+# steps earlier, spans[d] counts references that stay in the working set for
+# d steps at most (until the page's next reference or the end of the trace),
+# and cold is the number of first references.
+def reference_histograms(reference_string):
+    if not hasattr(reference_string, "__len__"):
+        reference_string = list(reference_string)
+    total = len(reference_string)
+    gaps = array("q", [0]) * (total + 1)
+    spans = array("q", [0]) * (total + 1)
+    last_seen = {}
+    cold = 0
+    for time, page in enumerate(reference_string):
+        previous = last_seen.get(page)
+        if previous is None:
+            cold += 1
+        else:
+            gaps[time - previous] += 1
+            spans[time - previous] += 1
+        last_seen[page] = time
+    # The last reference to each page spans to the end of the trace
+    for time in last_seen.values():
+        spans[total - time] += 1
+    return gaps, spans, cold
+
+
+# Returns (window, faults, fault rate, average working set) rows for every
+# window from 1 to max_window in one pass over the trace. A reference faults
+# when its backward gap exceeds the window, and contributes min(window, span)
+# steps of residency, so both follow from running sums over the histograms.
+# max_window defaults to the trace length, beyond which nothing changes.
+def working_set_curve(reference_string, max_window=None):
+    if not hasattr(reference_string, "__len__"):
+        reference_string = list(reference_string)
+    total = len(reference_string)
+    gaps, spans, cold = reference_histograms(reference_string)
+    if max_window is None:
+        max_window = total
+
+    curve = []
+    faults = total  # With a window of 0 every reference would fault
+    short_span_steps = 0  # Sum of the spans no longer than the window
+    long_spans = total  # Number of spans longer than the window
+    for window in range(1, max_window + 1):
+        if window <= total:
+            faults -= gaps[window]
+            short_span_steps += window * spans[window]
+            long_spans -= spans[window]
+        resident_steps = short_span_steps + window * long_spans
+        curve.append((window, faults,
+                      faults / total if total else 0.0,
+                      resident_steps / total if total else 0.0))
+    return curve
+
+
+# Writes a working-set curve as CSV with a header row.
+def write_working_set_csv(curve, stream):
+    writer = csv.writer(stream)
+    writer.writerow(CURVE_FIELDS)
+    writer.writerows(curve)
+
+
+if __name__ == "__main__":
+    from PageInterner import ID_TYPECODE, PageInterner
+    from TraceReader import read_interned_chunks
+
+    parser = argparse.ArgumentParser(
+        description="Print the working-set fault rate and average size for every window.")
+    parser.add_argument("trace", help="text trace file, or - for stdin")
+    parser.add_argument("--max-window", type=int, default=None)
+    args = parser.parse_args()
+
+    trace = array(ID_TYPECODE)
+    for chunk in read_interned_chunks(args.trace, PageInterner()):
+        trace.extend(chunk)
+    write_working_set_csv(working_set_curve(trace, args.max_window), sys.stdout)
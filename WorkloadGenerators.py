@@ -0,0 +1,345 @@
+import argparse
+import math
+import random
+from array import array
+from itertools import accumulate
+
+from BinaryTrace import write_binary_chunks
+from PageInterner import ID_TYPECODE
+from TraceReader import DEFAULT_CHUNK_SIZE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the generators fall back to the random module
+    np = None
+
+
+class Workload:
+    # Base class of the synthetic workload models. A model is seeded once and
+    # then produces references on demand through fill(count); the same seed
+    # always gives the same trace. NumPy and the pure-Python fallback draw from
+    # different generators, so a seed is only reproducible on the same backend.
+    name = None
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+
+    # Returns the next count page ids as a NumPy array or a list.
+    def fill(self, count):
+        raise NotImplementedError
+
+    # Yields length references as array('I') chunks of at most chunk_size.
+    def chunks(self, length, chunk_size=DEFAULT_CHUNK_SIZE):
+        for start in range(0, length, chunk_size):
+            yield as_id_array(self.fill(min(chunk_size, length - start)))
+
+    # Returns length references as one array('I').
+    def trace(self, length):
+        pages = array(ID_TYPECODE)
+        for chunk in self.chunks(length):
+            pages.extend(chunk)
+        return pages
+
+
+# Converts a NumPy array or list of page ids to an array('I').
+def as_id_array(values):
+    if np is not None and isinstance(values, np.ndarray):
+        pages = array(ID_TYPECODE)
+        pages.frombytes(values.astype(np.dtype(ID_TYPECODE), copy=False).tobytes())
+        return pages
+    return array(ID_TYPECODE, values)
+
+
+# Joins the pieces a model produced for one fill call.
+def concatenate(pieces):
+    if np is not None:
+        return np.concatenate(pieces) if pieces else np.empty(0, dtype=np.int64)
+    values = []
+    for piece in pieces:
+        values.extend(piece)
+    return values
+
+
+class ZipfWorkload(Workload):
+    # Page k (0-based) is referenced with probability proportional to
+    # 1 / (k + 1) ** alpha, so low page ids are the hot ones.
+    name = "zipf"
+
+    def __init__(self, pages, alpha=1.0, seed=None):
+        super().__init__(seed)
+        if pages < 1:
+            raise ValueError("pages must be at least 1")
+        self.pages = pages
+        if np is not None:
+            weights = np.arange(1, pages + 1, dtype=np.float64) ** -alpha
+            self.cdf = np.cumsum(weights)
+            self.cdf /= self.cdf[-1]
+        else:
+            self.cdf = list(accumulate((k + 1) ** -alpha for k in range(pages)))
+
+    # Draws count pages by inverting the cumulative distribution.
+    def fill(self, count):
+        if np is not None:
+            ranks = np.searchsorted(self.cdf, self.rng.random(count), side="right")
+            return np.minimum(ranks, self.pages - 1)
+        return self.rng.choices(range(self.pages), cum_weights=self.cdf, k=count)
+
+
+class WorkingSetWorkload(Workload):
+    # Phase-change model: every phase_length references a new working set of
+    # working_set pages is drawn. Within a phase a fraction locality of the
+    # references fall inside the working set, the rest anywhere.
+    name = "working-set"
+
+    def __init__(self, pages, working_set, phase_length, locality=0.9, seed=None):
+        super().__init__(seed)
+        if not 1 <= working_set <= pages:
+            raise ValueError("working_set must be between 1 and pages")
+        if phase_length < 1:
+            raise ValueError("phase_length must be at least 1")
+        self.pages = pages
+        self.working_set = working_set
+        self.phase_length = phase_length
+        self.locality = locality
+        self.phase_left = 0
+        self.current_set = None
+
+    # Draws a new working set.
+    def new_phase(self):
+        if np is not None:
+            self.current_set = self.rng.choice(self.pages, self.working_set, replace=False)
+        else:
+            self.current_set = self.rng.sample(range(self.pages), self.working_set)
+        self.phase_left = self.phase_length
+
+    # Draws count references, starting new phases as they run out.
+    def fill(self, count):
+        pieces = []
+        while count:
+            if not self.phase_left:
+                self.new_phase()
+            run = min(count, self.phase_left)
+            pieces.append(self.draw(run))
+            self.phase_left -= run
+            count -= run
+        return concatenate(pieces)
+
+    # Draws run references of the current phase.
+    def draw(self, run):
+        if np is not None:
+            local = self.rng.random(run) < self.locality
+            inside = self.current_set[self.rng.integers(0, self.working_set, run)]
+            outside = self.rng.integers(0, self.pages, run)
+            return np.where(local, inside, outside)
+        rng = self.rng
+        current_set = self.current_set
+        return [rng.choice(current_set) if rng.random() < self.locality else rng.randrange(self.pages)
+                for _ in range(run)]
+
+
+class LoopWorkload(Workload):
+    # Cycles over pages 0 .. loop_length - 1. With scan_length > 0, every
+    # scan_every loop references are followed by a scan of scan_length pages
+    # that are never referenced again. The model is deterministic; the seed is
+    # accepted only so every model has the same signature.
+    name = "loop"
+
+    def __init__(self, loop_length, scan_length=0, scan_every=0, seed=None):
+        super().__init__(seed)
+        if loop_length < 1:
+            raise ValueError("loop_length must be at least 1")
+        if scan_length and scan_every < 1:
+            raise ValueError("scan_every must be at least 1 when scanning")
+        self.loop_length = loop_length
+        self.scan_length = scan_length
+        self.scan_every = scan_every if scan_length else 1
+        self.position = 0
+
+    # Returns the references at positions start .. start + count - 1.
+    def fill(self, count):
+        start = self.position
+        self.position += count
+        period = self.scan_every + self.scan_length
+        if np is not None:
+            positions = np.arange(start, start + count, dtype=np.int64)
+            cycle, phase = np.divmod(positions, period)
+            loop = (cycle * self.scan_every + phase) % self.loop_length
+            scan = self.loop_length + cycle * self.scan_length + phase - self.scan_every
+            return np.where(phase < self.scan_every, loop, scan)
+        pages = []
+        for position in range(start, start + count):
+            cycle, phase = divmod(position, period)
+            if phase < self.scan_every:
+                pages.append((cycle * self.scan_every + phase) % self.loop_length)
+            else:
+                pages.append(self.loop_length + cycle * self.scan_length + phase - self.scan_every)
+        return pages
+
+
+class SequentialWorkload(Workload):
+    # Walks pages in order, wrapping at pages, and with probability
+    # jump_probability per reference jumps to a uniformly chosen page instead.
+    name = "sequential"
+
+    def __init__(self, pages, jump_probability=0.01, seed=None):
+        super().__init__(seed)
+        if pages < 1:
+            raise ValueError("pages must be at least 1")
+        self.pages = pages
+        self.jump_probability = jump_probability
+        self.next_page = 0
+
+    # Draws count references. With NumPy every run between jumps is an
+    # arithmetic sequence, so each page is its run's base plus its offset.
+    def fill(self, count):
+        if not count:
+            return concatenate([])
+        if np is not None:
+            jumps = self.rng.random(count) < self.jump_probability
+            targets = self.rng.integers(0, self.pages, count)
+            jump_positions = np.flatnonzero(jumps)
+            run = np.cumsum(jumps)
+            starts = np.concatenate(([0], jump_positions))
+            bases = np.concatenate(([self.next_page], targets[jump_positions]))
+            positions = np.arange(count, dtype=np.int64)
+            pages = (bases[run] + positions - starts[run]) % self.pages
+            self.next_page = int(pages[-1] + 1) % self.pages
+            return pages
+        rng = self.rng
+        page = self.next_page
+        pages = []
+        for _ in range(count):
+            if rng.random() < self.jump_probability:
+                page = rng.randrange(self.pages)
+            pages.append(page)
+            page = (page + 1) % self.pages
+        self.next_page = page
+        return pages
+
+
+class MarkovWorkload(Workload):
+    # First-order Markov chain over regions of region_size pages each:
+    # transitions[i][j] is the probability that a reference in region i is
+    # followed by one in region j, and pages within a region are uniform. The
+    # stay in a region is drawn as one geometric run, so work is per region
+    # change rather than per reference.
+    name = "markov"
+
+    def __init__(self, transitions, region_size, seed=None):
+        super().__init__(seed)
+        regions = len(transitions)
+        if not regions or any(len(row) != regions for row in transitions):
+            raise ValueError("transitions must be a non-empty square matrix")
+        if any(abs(sum(row) - 1.0) > 1e-9 or min(row) < 0 for row in transitions):
+            raise ValueError("each row of transitions must be a probability distribution")
+        if region_size < 1:
+            raise ValueError("region_size must be at least 1")
+        self.region_size = region_size
+        self.stay = [row[index] for index, row in enumerate(transitions)]
+        # Cumulative weights of leaving each region for every other one
+        self.leave = [list(accumulate(0.0 if index == target else weight
+                                      for target, weight in enumerate(row)))
+                      for index, row in enumerate(transitions)]
+        self.region = 0
+        self.run_left = 0
+
+    # Returns how many references the chain stays in the current region.
+    def draw_run(self):
+        stay = self.stay[self.region]
+        if stay >= 1.0:
+            return math.inf
+        if np is not None:
+            return int(self.rng.geometric(1.0 - stay))
+        return int(math.log(1.0 - self.rng.random()) / math.log(stay)) + 1 if stay > 0 else 1
+
+    # Moves to a different region.
+    def leave_region(self):
+        weights = self.leave[self.region]
+        target = self.rng.random() * weights[-1]
+        self.region = next(index for index, weight in enumerate(weights) if weight > target)
+
+    # Draws count references, changing region whenever a run is used up.
+    def fill(self, count):
+        pieces = []
+        while count:
+            if not self.run_left:
+                self.run_left = self.draw_run()
+            run = min(count, self.run_left)
+            base = self.region * self.region_size
+            if np is not None:
+                pieces.append(base + self.rng.integers(0, self.region_size, run))
+            else:
+                pieces.append([base + self.rng.randrange(self.region_size) for _ in range(run)])
+            self.run_left -= run
+            count -= run
+            if not self.run_left:
+                self.leave_region()
+        return concatenate(pieces)
+
+
+WORKLOADS = {
+    workload.name: workload
+    for workload in (ZipfWorkload, WorkingSetWorkload, LoopWorkload, SequentialWorkload, MarkovWorkload)
+}
+
+
+# Writes chunks of page ids as a whitespace-separated text trace, one chunk per
+# line. Returns the number of references written.
+def write_text_chunks(path, chunks):
+    count = 0
+    with open(path, "w") as stream:
+        for chunk in chunks:
+            stream.write(" ".join(map(str, chunk)))
+            stream.write("\n")
+            count += len(chunk)
+    return count
+
+
+# Parses a transition matrix written as rows separated by ";" and
+# probabilities separated by ",".
+def parse_transitions(text):
+    return [[float(value) for value in row.split(",")] for row in text.split(";")]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic page reference trace.")
+    parser.add_argument("output", help="trace file to write")
+    parser.add_argument("--length", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--format", choices=["binary", "text"], default="binary")
+    parser.add_argument("--width", type=int, default=4, help="page id width of binary traces")
+    models = parser.add_subparsers(dest="model", required=True)
+
+    zipf = models.add_parser("zipf")
+    zipf.add_argument("--pages", type=int, required=True)
+    zipf.add_argument("--alpha", type=float, default=1.0)
+
+    working_set = models.add_parser("working-set")
+    working_set.add_argument("--pages", type=int, required=True)
+    working_set.add_argument("--working-set", type=int, required=True)
+    working_set.add_argument("--phase-length", type=int, required=True)
+    working_set.add_argument("--locality", type=float, default=0.9)
+
+    loop = models.add_parser("loop")
+    loop.add_argument("--loop-length", type=int, required=True)
+    loop.add_argument("--scan-length", type=int, default=0)
+    loop.add_argument("--scan-every", type=int, default=0)
+
+    sequential = models.add_parser("sequential")
+    sequential.add_argument("--pages", type=int, required=True)
+    sequential.add_argument("--jump-probability", type=float, default=0.01)
+
+    markov = models.add_parser("markov")
+    markov.add_argument("--transitions", type=parse_transitions, required=True,
+                        help='rows separated by ";", probabilities by ",", e.g. "0.9,0.1;0.2,0.8"')
+    markov.add_argument("--region-size", type=int, required=True)
+
+    args = parser.parse_args()
+    options = {key: value for key, value in vars(args).items()
+               if key not in ("output", "length", "format", "width", "model")}
+    workload = WORKLOADS[args.model](**options)
+    chunks = workload.chunks(args.length)
+    if args.format == "binary":
+        write_binary_chunks(args.output, chunks, args.width)
+    else:
+        write_text_chunks(args.output, chunks)
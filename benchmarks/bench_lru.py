@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SimulationEngine import LruEngine
+
+FRAME_COUNTS = [4, 64, 1024, 16384, 262144, 1000000]
+REFERENCES = 2000000
+
+
+# Builds a reference string over twice as many pages as frames so that
+# roughly half of the references miss and force an eviction.
+def make_trace(frames, length, seed=0):
+    rng = random.Random(seed)
+    pages = 2 * frames
+    return [rng.randrange(pages) for _ in range(length)]
+
+
+# Measures the per-reference cost of the LRU engine for one frame count.
+def bench(frames, length):
+    trace = make_trace(frames, length)
+    engine = LruEngine(frames)
+    engine.reset()
+    step = engine.step
+
+    start = time.perf_counter()
+    for page in trace:
+        step(page)
+    elapsed = time.perf_counter() - start
+    return elapsed / length * 1e9, engine.page_faults
+
+
+if __name__ == "__main__":
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else REFERENCES
+    print(f"{'frames':>10} {'ns/ref':>10} {'faults':>12}")
+    for frames in FRAME_COUNTS:
+        ns_per_ref, faults = bench(frames, length)
+        print(f"{frames:>10} {ns_per_ref:>10.1f} {faults:>12}")
@@ -0,0 +1,73 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+
+# Each snippet runs in a fresh interpreter and prints the seconds from just
+# before its first import until the window has been shown and painted once.
+MAIN_WINDOW = """
+import time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+app = QApplication([])
+from MainWindow import MainWindow
+window = MainWindow()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+"""
+
+# The previous startup path: parse Page_Simulator.ui at runtime with QUiLoader.
+UI_LOADER = """
+import time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication, QMainWindow
+from PySide6.QtUiTools import QUiLoader
+app = QApplication([])
+window = QMainWindow()
+window.setCentralWidget(QUiLoader().load("Page_Simulator.ui", None))
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+"""
+
+# Only builds the precompiled UI class, for comparison with UI_LOADER.
+UI_CLASS = """
+import time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication, QDialog, QMainWindow
+from Page_Simulator_ui import Ui_MainWindow
+app = QApplication([])
+window = QMainWindow()
+widget = QDialog()
+Ui_MainWindow().setupUi(widget)
+window.setCentralWidget(widget)
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+"""
+
+
+# Runs a snippet in a fresh offscreen interpreter and returns its timing and
+# the wall time of the whole process, which includes interpreter startup.
+def time_snippet(snippet):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", snippet], cwd=ROOT, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    wall = time.perf_counter() - start
+    return float(output.split()[-1]), wall
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    print(f"{'startup path':<22} {'window ms':>10} {'process ms':>11}")
+    for name, snippet in [("MainWindow", MAIN_WINDOW), ("QUiLoader .ui", UI_LOADER), ("precompiled UI class", UI_CLASS)]:
+        timings = [time_snippet(snippet) for _ in range(runs)]
+        window = statistics.median(timing[0] for timing in timings) * 1000
+        wall = statistics.median(timing[1] for timing in timings) * 1000
+        print(f"{name:<22} {window:>10.1f} {wall:>11.1f}")
@@ -0,0 +1,247 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from BinaryTrace import BinaryTrace, convert_text_trace
+from PageInterner import PageInterner
+from SimulationEngine import ENGINES
+from TraceReader import read_interned_chunks, read_trace_chunks
+from WorkloadGenerators import ZipfWorkload, write_text_chunks
+
+ENGINE_POLICIES = ["FIFO", "LRU", "OPTIMAL"]
+TRACE_SIZES = [10000, 100000, 1000000]
+FRAME_COUNTS = [4, 64, 1024]
+INGEST_SIZE = 1000000
+RENDER_STEPS = 500
+RENDER_SEQUENCE_LENGTH = 100000
+REPEATS = 3
+SEED = 1234
+
+
+# Returns a Zipf trace over ten times as many pages as the largest frame count,
+# so every frame count sees both hits and misses.
+def make_trace(length):
+    return list(ZipfWorkload(10 * max(FRAME_COUNTS), alpha=0.8, seed=SEED).trace(length))
+
+
+# Returns the best of repeats timings of a call, in seconds.
+def best_time(call, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+# Measures references per second of the engines for every trace size and
+# frame count. Optimal's next-use pass is included in its time.
+def bench_engines(repeats, sizes):
+    results = []
+    for size in sizes:
+        trace = make_trace(size)
+        for policy in ENGINE_POLICIES:
+            for frames in FRAME_COUNTS:
+                engine = ENGINES[policy](frames)
+                seconds = best_time(lambda: engine.count_faults(trace), repeats)
+                results.append({
+                    "group": "engine",
+                    "name": f"{policy}/{frames} frames/{size} refs",
+                    "seconds": seconds,
+                    "per_second": size / seconds,
+                    "faults": engine.page_faults,
+                })
+    return results
+
+
+# Measures trace ingestion: text parsing, interning, text to binary
+# conversion and iterating a mapped binary trace.
+def bench_ingest(repeats, size, scratch):
+    text_path = os.path.join(scratch, "ingest.txt")
+    binary_path = os.path.join(scratch, "ingest.bin")
+    write_text_chunks(text_path, ZipfWorkload(100000, seed=SEED).chunks(size))
+
+    def parse():
+        for _ in read_trace_chunks(text_path):
+            pass
+
+    def intern():
+        for _ in read_interned_chunks(text_path, PageInterner()):
+            pass
+
+    def convert():
+        convert_text_trace(text_path, binary_path)
+
+    def iterate_binary():
+        with BinaryTrace(binary_path) as trace:
+            for chunk in trace.chunks():
+                for _ in chunk:
+                    pass
+                chunk.release()
+
+    results = []
+    for name, call in [("parse text", parse), ("intern text", intern),
+                       ("convert text to binary", convert), ("iterate binary", iterate_binary)]:
+        seconds = best_time(call, repeats)
+        results.append({
+            "group": "ingest",
+            "name": f"{name}/{size} refs",
+            "seconds": seconds,
+            "per_second": size / seconds,
+        })
+    return results
+
+
+# Per-step render latency under the offscreen Qt platform, run in a fresh
+# interpreter so the platform can be chosen before Qt is loaded. Prints one
+# JSON line per result as soon as it is measured.
+RENDER_SCRIPT = """
+import json, os, statistics, sys, time
+sys.path.insert(0, sys.argv[1])
+steps, length = int(sys.argv[2]), int(sys.argv[3])
+from PySide6.QtWidgets import QApplication, QDialog
+from Page_Simulator_ui import Ui_MainWindow
+from FrameBoxes import FrameBoxPool
+from PolicySimulator import PolicySimulator
+from PageSequenceDisplay import display_page_sequence
+from WorkloadGenerators import ZipfWorkload
+
+app = QApplication([])
+widget = QDialog()
+ui = Ui_MainWindow()
+ui.setupUi(widget)
+widget.show()
+reference = " ".join(map(str, ZipfWorkload(50, seed=%d).trace(length)))
+
+def latencies(call, count):
+    timings = []
+    for index in range(count):
+        start = time.perf_counter()
+        call(index)
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def report(name, timings):
+    timings = sorted(timings)
+    print(json.dumps({"group": "render", "name": name, "seconds": statistics.median(timings),
+                      "p95_seconds": timings[int(len(timings) * 0.95)], "samples": len(timings)}),
+          flush=True)
+
+pool = FrameBoxPool.for_frame(ui.New_Process)
+boxes = [[(str(page), None) for page in range(index %% 8, index %% 8 + 8)] for index in range(steps)]
+report("show_boxes/8 boxes", latencies(lambda index: pool.show_boxes(boxes[index]), steps))
+report(f"display_page_sequence/{length} pages", latencies(
+    lambda index: display_page_sequence(ui.Page_Sequence_Container, reference), 5))
+
+simulator = PolicySimulator(ui, "LRU")
+simulator.start(reference, 8)
+report("LRU render step", latencies(lambda index: simulator.next(), steps))
+report("LRU seek", latencies(lambda index: simulator.seek((index * 7919) %% length), steps))
+# Skip interpreter shutdown, where some PySide6 releases crash after the
+# results are printed
+os._exit(0)
+""" % SEED
+
+
+# Runs the render benchmarks in a subprocess, or reports why they were skipped.
+def bench_render(steps, length):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    completed = subprocess.run([sys.executable, "-c", RENDER_SCRIPT, ROOT, str(steps), str(length)],
+                               env=env, capture_output=True, text=True)
+    # Results printed before a crash are still valid
+    results = []
+    for line in completed.stdout.splitlines():
+        try:
+            results.append(json.loads(line))
+        except ValueError:
+            pass
+    if completed.returncode != 0 or not results:
+        lines = completed.stderr.strip().splitlines()
+        errors = [line for line in lines if "error" in line.lower()]
+        reason = (errors or lines or ["failed"])[-1]
+        results.append({"group": "render", "name": "skipped", "reason": reason})
+    return results
+
+
+# Returns where and on what the benchmarks ran.
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# Prints each result next to the same result of a previous run. Ratios above 1
+# mean the current run is slower.
+def compare(results, baseline):
+    previous = {(entry["group"], entry["name"]): entry for entry in baseline["results"]}
+    print(f"{'benchmark':<52} {'before':>12} {'after':>12} {'ratio':>7}")
+    for entry in results:
+        old = previous.get((entry["group"], entry["name"]))
+        if old is None or "seconds" not in entry or "seconds" not in old:
+            continue
+        ratio = entry["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        print(f"{entry['group'] + ': ' + entry['name']:<52} "
+              f"{old['seconds'] * 1e3:>10.3f}ms {entry['seconds'] * 1e3:>10.3f}ms {ratio:>7.2f}")
+
+
+# Prints results as a table.
+def report(results):
+    for entry in results:
+        label = f"{entry['group']}: {entry['name']}"
+        if "per_second" in entry:
+            print(f"{label:<52} {entry['per_second'] / 1e6:>10.2f}M/s")
+        elif "seconds" in entry:
+            print(f"{label:<52} {entry['seconds'] * 1e6:>10.1f}us median, "
+                  f"{entry['p95_seconds'] * 1e6:.1f}us p95")
+        else:
+            print(f"{label:<52} {entry.get('reason', '')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark engines, trace ingestion and rendering.")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--groups", nargs="+", choices=["engine", "ingest", "render"],
+                        default=["engine", "ingest", "render"])
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--quick", action="store_true", help="use only the smaller trace sizes")
+    args = parser.parse_args()
+
+    sizes = TRACE_SIZES[:2] if args.quick else TRACE_SIZES
+    ingest_size = INGEST_SIZE // 10 if args.quick else INGEST_SIZE
+    results = []
+    if "engine" in args.groups:
+        results.extend(bench_engines(args.repeats, sizes))
+    if "ingest" in args.groups:
+        with tempfile.TemporaryDirectory() as scratch:
+            results.extend(bench_ingest(args.repeats, ingest_size, scratch))
+    if "render" in args.groups:
+        results.extend(bench_render(RENDER_STEPS, RENDER_SEQUENCE_LENGTH))
+
+    report(results)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump({"environment": environment(), "results": results}, stream, indent=2)
+            stream.write("\n")
+    if args.compare:
+        with open(args.compare) as stream:
+            compare(results, json.load(stream))
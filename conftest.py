@@ -0,0 +1 @@
+# Lets pytest, run from anywhere, import the top-level modules from tests/.
@@ -0,0 +1,27 @@
+import pytest
+
+from BinaryTrace import HEADER, MAGIC, VERSION, BinaryTrace, write_binary_trace
+
+
+# Traces with every optional array read back as written.
+def test_round_trip_with_timestamps_and_pids(tmp_path):
+    path = tmp_path / "trace.bin"
+    write_binary_trace(path, [3, 1, 4, 1, 5], width=2, timestamps=[10, 20, 30, 40, 50], pids=[1, 2, 1, 2, 1])
+    with BinaryTrace(path) as trace:
+        assert list(trace.pages) == [3, 1, 4, 1, 5]
+        assert list(trace.timestamps) == [10, 20, 30, 40, 50]
+        assert list(trace.pids) == [1, 2, 1, 2, 1]
+
+
+# Short and truncated files are rejected with ValueError, not struct or
+# memoryview errors.
+@pytest.mark.parametrize("content", [
+    MAGIC,
+    HEADER.pack(MAGIC, VERSION, 4, 0, 100) + bytes(10),
+    HEADER.pack(MAGIC, VERSION, 4, 0x2, 4) + bytes(16),
+])
+def test_truncated_files_are_not_traces(tmp_path, content):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(content)
+    with pytest.raises(ValueError, match="is not a binary trace"):
+        BinaryTrace(path)
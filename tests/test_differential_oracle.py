@@ -0,0 +1,7 @@
+from DifferentialOracle import REFERENCE_POLICIES, run_oracle
+
+
+# Every engine with a reference policy must match the original simulator logic
+# step by step on a few hundred random cases.
+def test_engines_match_reference_simulators():
+    assert run_oracle(list(REFERENCE_POLICIES), 300, 0) == []
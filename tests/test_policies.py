@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from SimulationEngine import ENGINES, ArcEngine, ClockEngine, LirsEngine, TwoQueueEngine
+
+
+# Random traces with enough reuse to exercise hits, evictions and ghost lists.
+def random_traces():
+    rng = random.Random(7)
+    for _ in range(40):
+        pages = rng.randint(2, 12)
+        yield [rng.randrange(pages) for _ in range(rng.randint(1, 200))], rng.randint(1, 6)
+
+
+# Every registered engine keeps the frames consistent with its StepResults.
+@pytest.mark.parametrize("policy", list(ENGINES))
+def test_step_invariants(policy):
+    for reference_string, max_frames in random_traces():
+        engine = ENGINES[policy](max_frames)
+        resident = set()
+        faults = 0
+        for page, result in zip(reference_string, engine.steps(reference_string)):
+            frames = list(engine.frames)
+            assert result.page == page
+            assert result.hit == (page in resident)
+            if result.hit:
+                assert result.evicted is None
+            else:
+                faults += 1
+            if result.evicted is not None:
+                assert result.evicted in resident
+                assert result.evicted not in frames
+                resident.discard(result.evicted)
+            resident.add(page)
+            assert len(frames) <= max_frames
+            assert len(set(frames)) == len(frames)
+            assert set(frames) == resident
+            assert frames[result.slot] == page
+        assert ENGINES[policy](max_frames).count_faults(reference_string) == faults
+
+
+# Returns the page each reference evicted, or None.
+def evictions(engine_class, reference_string, max_frames):
+    return [result.evicted for result in engine_class(max_frames).run(reference_string)]
+
+
+# Traced by hand: a hit sets the reference bit of 2, so the hand passes it and
+# evicts 3 where FIFO would evict 2.
+def test_clock_known_sequence():
+    reference_string = [1, 2, 3, 4, 2, 5, 3, 1]
+    assert evictions(ClockEngine, reference_string, 3) == [None, None, None, 1, None, 3, 2, 4]
+    assert ClockEngine(3).count_faults(reference_string) == 7
+
+
+# Traced by hand from the ARC pseudocode (Megiddo and Modha) with c = 2: ghost
+# hits in B1 and B2 move the target p up and down.
+def test_arc_known_sequence():
+    reference_string = [1, 2, 1, 3, 2, 4, 1, 3]
+    engine = ArcEngine(2)
+    assert [result.evicted for result in engine.run(reference_string)] == \
+        [None, None, None, 2, 1, 2, 3, 1]
+    assert engine.page_faults == 7
+    assert engine.target == 1
+    assert list(engine.t1) == [4] and list(engine.t2) == [3]
+    assert list(engine.b1) == [] and list(engine.b2) == [2, 1]
+
+
+# Traced by hand from full 2Q (Johnson and Shasha) with 4 frames, Kin = 1 and
+# Kout = 2: pages remembered in A1out are promoted to Am, and Am gives up its
+# LRU page once A1in is within its share.
+def test_two_queue_known_sequence():
+    reference_string = [1, 2, 3, 4, 5, 1, 6, 1, 2, 7, 3, 1, 4, 6, 7]
+    engine = TwoQueueEngine(4)
+    assert [result.evicted for result in engine.run(reference_string)] == \
+        [None, None, None, None, 1, 2, 3, None, 4, 5, 6, None, 7, 3, 2]
+    assert engine.page_faults == 13
+    assert list(engine.am) == [1, 6, 7]
+    assert list(engine.a1in) == [4]
+    assert list(engine.a1out) == [3]
+
+
+# Traced by hand from LIRS (Jiang and Zhang) with 3 frames, two LIR and one
+# HIR: a non-resident HIR page still in S becomes LIR, and a resident HIR page
+# in S swaps status with the bottom LIR page.
+def test_lirs_known_sequence():
+    reference_string = [1, 2, 3, 4, 2, 1, 3, 4, 3, 2, 1, 2, 4]
+    engine = LirsEngine(3)
+    assert [result.evicted for result in engine.run(reference_string)] == \
+        [None, None, None, 3, None, None, 4, 3, 4, None, None, None, 3]
+    assert engine.page_faults == 8
+    assert engine.lir == {1, 2}
+    assert list(engine.stack) == [1, 2, 4]
+    assert list(engine.queue) == [4]
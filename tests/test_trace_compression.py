@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+import TraceCompression
+from BinaryTrace import BinaryTrace, write_binary_chunks
+from SimulationEngine import ENGINES, count_faults
+from SimulatorCli import run_trace, stream_trace
+from TraceCompression import count_faults_collapsed, expand_runs, run_length_encode
+
+REPEAT_SAFE = [policy for policy, engine_class in ENGINES.items() if engine_class.repeat_safe]
+
+
+# Returns a seeded trace of runs of repeated pages.
+def repeated_trace(seed, length=600, pages=10):
+    rng = random.Random(seed)
+    trace = []
+    while len(trace) < length:
+        trace.extend([rng.randrange(pages)] * rng.randint(1, 6))
+    return trace
+
+
+# Splits a trace into chunks of the given size.
+def split(trace, size):
+    return [trace[start:start + size] for start in range(0, len(trace), size)]
+
+
+# Collapsing repeats keeps the fault count of every repeat_safe engine exact.
+@pytest.mark.parametrize("policy", REPEAT_SAFE)
+def test_collapsed_faults_are_exact(policy):
+    for seed in range(10):
+        trace = repeated_trace(seed)
+        for frames in (1, 3, 7):
+            expected = count_faults(ENGINES[policy], trace, frames)
+            assert count_faults_collapsed(ENGINES[policy], trace, frames) == expected
+
+
+# Engines whose state a repeat can change are refused.
+def test_collapse_refuses_engines_that_are_not_repeat_safe():
+    for engine_class in ENGINES.values():
+        if not engine_class.repeat_safe:
+            with pytest.raises(ValueError):
+                count_faults_collapsed(engine_class, [1, 1, 2], 2)
+
+
+# Runs written from chunks that split them, and longer than one run-length
+# entry can hold, expand back to the original trace in any chunk size.
+def test_run_length_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(TraceCompression, "MAX_RUN_LENGTH", 4)
+    trace = repeated_trace(1) + [3] * 11
+    path = tmp_path / "trace.bin"
+    assert write_binary_chunks(path, split(trace, 5), run_length=True) == len(trace)
+    with BinaryTrace(path) as binary:
+        assert binary.references == len(trace)
+        assert max(binary.run_lengths) <= 4
+        for chunk_size in (1, 4, 7, 1000):
+            expanded = []
+            for chunk in binary.reference_chunks(chunk_size):
+                assert len(chunk) <= chunk_size
+                expanded.extend(chunk)
+            assert expanded == trace
+
+    pages, counts = run_length_encode(trace)
+    assert max(counts) == 4 and sum(counts) == len(trace)
+    assert [page for chunk in expand_runs(pages, counts, 3) for page in chunk] == trace
+
+
+# run_trace on a run-length file gives every engine the fault count of the
+# full trace, and so does collapse on the plain file, for 4- and 8-byte ids.
+@pytest.mark.parametrize("width, base", [(4, 0), (8, 1 << 40)])
+def test_run_trace_on_run_length_files_is_exact(tmp_path, width, base):
+    policies = list(ENGINES)
+    frame_sizes = [1, 3, 7]
+    trace = [base + page for page in repeated_trace(2)]
+    plain = tmp_path / "plain.bin"
+    runs = tmp_path / "runs.bin"
+    write_binary_chunks(plain, split(trace, 64), width)
+    write_binary_chunks(runs, split(trace, 64), width, run_length=True)
+    expected = [count_faults(ENGINES[policy], trace, frames) for policy in policies for frames in frame_sizes]
+
+    with BinaryTrace(runs) as binary:
+        rows = run_trace("runs", binary.pages, policies, frame_sizes, run_lengths=binary.run_lengths)
+    assert [row["faults"] for row in rows] == expected
+    assert all(row["references"] == len(trace) for row in rows)
+
+    with BinaryTrace(plain) as binary:
+        rows = run_trace("plain", binary.pages, policies, frame_sizes, stats=True, collapse=True)
+    assert [row["faults"] for row in rows] == expected
+    assert all(row["hits"] + row["faults"] == len(trace) for row in rows)
+
+
+# Streaming with collapse drops repeats that straddle chunk borders and stays
+# exact for every online engine.
+def test_streamed_collapse_is_exact():
+    policies = [policy for policy, engine_class in ENGINES.items() if not engine_class.offline]
+    trace = repeated_trace(3)
+    expected = [count_faults(ENGINES[policy], trace, 3) for policy in policies]
+    for chunk_size in (1, 5, 64):
+        rows = stream_trace("trace", split(trace, chunk_size), policies, [3], collapse=True)
+        assert [row["faults"] for row in rows] == expected
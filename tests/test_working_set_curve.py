@@ -0,0 +1,35 @@
+import random
+
+from SimulationEngine import WorkingSetEngine
+from WorkingSetCurve import working_set_curve
+
+
+# Returns the faults and average working set size for one window by rescanning
+# the last window references at every step.
+def brute_force(reference_string, window):
+    faults = 0
+    resident_steps = 0
+    for time, page in enumerate(reference_string):
+        if page not in reference_string[max(0, time - window):time]:
+            faults += 1
+        resident_steps += len(set(reference_string[max(0, time - window + 1):time + 1]))
+    return faults, resident_steps / len(reference_string)
+
+
+# The single-pass curve matches WorkingSetEngine and a brute-force window for
+# every window up to 15.
+def test_curve_matches_engine_and_brute_force():
+    rng = random.Random(11)
+    for _ in range(300):
+        pages = rng.randint(1, 8)
+        reference_string = [rng.randrange(pages) for _ in range(rng.randint(1, 60))]
+        curve = working_set_curve(reference_string, 15)
+        assert [row[0] for row in curve] == list(range(1, 16))
+        for window, faults, fault_rate, average in curve:
+            engine = WorkingSetEngine(window)
+            assert engine.count_faults(reference_string) == faults
+            assert abs(engine.average_resident() - average) < 1e-9
+            expected_faults, expected_average = brute_force(reference_string, window)
+            assert faults == expected_faults
+            assert abs(average - expected_average) < 1e-9
+            assert abs(fault_rate - faults / len(reference_string)) < 1e-12